@@ -4,13 +4,59 @@ Hours checking window module.
 Allows users to check their accumulated hours by tapping their RFID card.
 """
 
-from datetime import datetime, timedelta
-from threading import Thread
-from typing import Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Tuple
 from PyQt5 import QtWidgets, QtCore, QtGui
 
-from database_manager import DatabaseManager
+from database_manager import get_db_manager
 from rfid_reader import RFIDReader
+from rfid_worker import RFIDWorker
+from workers import Worker
+
+# Stylesheets are built once at import and shared by every window instance
+_DIALOG_QSS = """
+QDialog {
+    background-color: black;
+    color: white;
+}
+QLabel {
+    color: white;
+}
+"""
+
+_HEADER_QSS = """
+QWidget {
+    background: qlineargradient(
+        x1: 0, y1: 0, x2: 0, y2: 1,
+        stop: 0 rgba(0, 0, 0, 0.8),
+        stop: 1 rgba(0, 0, 0, 0.3)
+    );
+    border-radius: 15px;
+    padding: 20px;
+}
+"""
+
+_CONTENT_QSS = """
+QWidget {
+    background: rgba(255, 255, 255, 0.05);
+    border-radius: 15px;
+    padding: 20px;
+}
+"""
+
+_CLOSE_BUTTON_QSS = """
+QPushButton {
+    background-color: rgba(255, 255, 255, 0.1);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 5px;
+    padding: 15px 30px;
+    color: white;
+    min-width: 200px;
+}
+QPushButton:hover {
+    background-color: rgba(255, 255, 255, 0.2);
+}
+"""
 
 
 class CheckHoursWindow(QtWidgets.QDialog):
@@ -19,61 +65,49 @@ class CheckHoursWindow(QtWidgets.QDialog):
     Shows total hours and current session details if signed in.
     """
 
-    # Define a custom signal for RFID card detection
-    card_detected = QtCore.pyqtSignal(str)
-
     def __init__(
         self,
         parent: Optional[QtWidgets.QWidget] = None,
-        rfid_reader: Optional[RFIDReader] = None,
+        rfid_worker: Optional[RFIDWorker] = None,
     ) -> None:
         """
         Initialize the check hours window with necessary components.
 
         @param parent: Optional parent widget
-        @param rfid_reader: Optional existing RFID reader instance
+        @param rfid_worker: Optional shared RFID worker thread; a private one is
+                            created and stopped on close when omitted
         """
         super().__init__(parent)
-        self.rfid_reader = rfid_reader
+        self.rfid_worker = rfid_worker
+        self._owns_worker = rfid_worker is None
+        self._torn_down = False  # Set once _tear_down has run
+        # (day computed on, start of that day's week); recomputed once per day
+        self._week_start_cache: Tuple[date, datetime] = (date.min, datetime.min)
+        self._last_color: Optional[str] = None  # Current info label text color
 
         # Set window properties for full screen
         self.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.FramelessWindowHint)
         self.setWindowState(QtCore.Qt.WindowFullScreen)
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: black;
-                color: white;
-            }
-            QLabel {
-                color: white;
-            }
-        """
-        )
+        self.setStyleSheet(_DIALOG_QSS)
 
         try:
-            # Initialize database manager
-            self.db_manager = DatabaseManager()
-            if self.rfid_reader is None:
-                self.rfid_reader = RFIDReader()
+            # Use the shared database manager
+            self.db_manager = get_db_manager()
+            if self.rfid_worker is None:
+                self.rfid_worker = RFIDWorker(RFIDReader(), self)
 
             self.setup_ui()
 
-            # Connect the card detected signal to the handler
-            self.card_detected.connect(self.handle_card_tap)
+            # Subscribe to card reads from the worker thread
+            self.rfid_worker.card_detected.connect(self.handle_card_tap)
 
         except Exception as e:
             self._show_error_and_close(f"Failed to initialize components: {str(e)}")
             return
 
-        # Start RFID reader
+        # Start RFID reader (no-op when the shared worker is already running)
         try:
-            self.reader_thread = Thread(
-                target=self.rfid_reader.start_reading,
-                args=(self._on_card_detected,),
-                daemon=True,
-            )
-            self.reader_thread.start()
+            self.rfid_worker.start()
         except Exception as e:
             self._show_error_and_close(f"Failed to start RFID reader: {str(e)}")
             return
@@ -97,19 +131,7 @@ class CheckHoursWindow(QtWidgets.QDialog):
 
         # Header container with gradient background
         header_container = QtWidgets.QWidget()
-        header_container.setStyleSheet(
-            """
-            QWidget {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 rgba(0, 0, 0, 0.8),
-                    stop: 1 rgba(0, 0, 0, 0.3)
-                );
-                border-radius: 15px;
-                padding: 20px;
-            }
-        """
-        )
+        header_container.setStyleSheet(_HEADER_QSS)
         header_layout = QtWidgets.QVBoxLayout(header_container)
 
         # Title
@@ -133,15 +155,7 @@ class CheckHoursWindow(QtWidgets.QDialog):
 
         # Content container
         content_container = QtWidgets.QWidget()
-        content_container.setStyleSheet(
-            """
-            QWidget {
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 15px;
-                padding: 20px;
-            }
-        """
-        )
+        content_container.setStyleSheet(_CONTENT_QSS)
         content_layout = QtWidgets.QVBoxLayout(content_container)
 
         # Info display
@@ -149,7 +163,7 @@ class CheckHoursWindow(QtWidgets.QDialog):
         self.info_label.setAlignment(QtCore.Qt.AlignCenter)
         self.info_label.setFont(QtGui.QFont("Arial", info_size))
         self.info_label.setWordWrap(True)
-        self.info_label.setStyleSheet("color: white;")
+        self._set_color("white")
         content_layout.addWidget(self.info_label)
 
         main_layout.addWidget(content_container)
@@ -161,21 +175,7 @@ class CheckHoursWindow(QtWidgets.QDialog):
         # Close button
         close_btn = QtWidgets.QPushButton("Close", self)
         close_btn.setFont(QtGui.QFont("Arial", button_size))
-        close_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 5px;
-                padding: 15px 30px;
-                color: white;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-        """
-        )
+        close_btn.setStyleSheet(_CLOSE_BUTTON_QSS)
         close_btn.clicked.connect(self.close)
         button_layout.addWidget(close_btn)
 
@@ -195,120 +195,156 @@ class CheckHoursWindow(QtWidgets.QDialog):
         QtWidgets.QMessageBox.critical(self, "Error", message)
         self.reject()
 
-    def _on_card_detected(self, card_id: str) -> None:
+    def _set_color(self, color: str) -> None:
+        """
+        Sets the info label text color, skipping the restyle if unchanged.
+
+        @param color: CSS color name for the info label text
         """
-        Callback function for RFID card detection.
+        if color == self._last_color:
+            return
+        self._last_color = color
+        self.info_label.setStyleSheet(f"color: {color};")
+
+    def _get_start_of_week(self) -> datetime:
+        """
+        Returns midnight on Monday of the current week, cached for the day.
 
-        @param card_id: The detected card's ID
+        @return: Timezone-aware start of the current week
         """
-        if card_id:
-            self.card_detected.emit(card_id)
+        today = date.today()
+        cached_day, start_of_week = self._week_start_cache
+        if cached_day != today:
+            monday = today - timedelta(days=today.weekday())
+            start_of_week = datetime(
+                monday.year, monday.month, monday.day, tzinfo=timezone.utc
+            )
+            self._week_start_cache = (today, start_of_week)
+        return start_of_week
 
+    @QtCore.pyqtSlot(str)
     def handle_card_tap(self, rfid_tag: str) -> None:
         """
-        Handles a card tap event, displays the member's hours for the current week.
+        Handles a card tap event. The database lookups run on the thread pool
+        and the result is shown by _apply_result on the GUI thread.
 
         @param rfid_tag: The RFID card identifier
         """
-        try:
-            # Get member information
-            member = self.db_manager.get_member_by_rfid(rfid_tag)
-            if not member:
-                self.info_label.setText("Error: Unknown RFID card.")
-                self.info_label.setStyleSheet("color: red;")
-                return
-
-            # Get active session if any
-            active_session = self.db_manager.get_active_session(member["id"])
-
-            # Get all sessions for the member from the current week
-            # Get the start of the current week (Monday)
-            current_date = datetime.now()
-            start_of_week = current_date - timedelta(days=current_date.weekday())
-            start_of_week = start_of_week.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
+        worker = Worker(self._lookup_hours, rfid_tag)
+        worker.signals.finished.connect(self._apply_result)
+        worker.signals.error.connect(self._apply_error)
+        QtCore.QThreadPool.globalInstance().start(worker)
 
-            # Query only sessions from this week
-            response = (
-                self.db_manager.supabase.table("asg_logs")
-                .select("*")
-                .eq("user_id", member["id"])
-                .gte("sign_in_time", start_of_week.isoformat() + "Z")
-                .order("sign_in_time", desc=True)
-                .execute()
+    def _lookup_hours(self, rfid_tag: str) -> Tuple[str, Optional[str]]:
+        """
+        Queries the member's hours for the current week. Runs off the GUI
+        thread and must not touch any widgets.
+
+        @param rfid_tag: The RFID card identifier
+        @return: The message to display and its color (None keeps the current color)
+        """
+        # Get member information
+        member = self.db_manager.get_member_by_rfid(rfid_tag)
+        if not member:
+            return "Error: Unknown RFID card.", "red"
+
+        # Get the start of the current week (Monday)
+        start_of_week = self._get_start_of_week()
+
+        # Fetch the active session (if any) and this week's completed hours
+        active_session, current_week_hours = self.db_manager.get_hours_summary(
+            member["id"], start_of_week
+        )
+
+        if not current_week_hours and not active_session:
+            return f"No hours recorded this week for {member['name']}", None
+
+        # Add current active session duration if exists
+        current_duration = 0.0
+        if active_session:
+            try:
+                # Build the sign in time from epoch seconds (no ISO parsing)
+                sign_in_time = datetime.fromtimestamp(
+                    active_session["sign_in_epoch"], tz=timezone.utc
+                ).astimezone()
+                current_time = datetime.now(timezone.utc)
+                current_duration = (
+                    current_time - sign_in_time
+                ).total_seconds() / 3600.0
+
+                if sign_in_time >= start_of_week:
+                    current_week_hours += current_duration
+            except (ValueError, TypeError, KeyError) as e:
+                print(f"Error calculating current session duration: {e}")
+                current_duration = 0.0
+
+        # Format the display message
+        message = (
+            f"Member: {member['name']} ({member['position']})\n"
+            f"Current Week Hours: {current_week_hours:.2f}"
+        )
+        if active_session and current_duration > 0:
+            message += (
+                "\n\nCurrent Session:\n"
+                f"Signed in at: {sign_in_time:%I:%M %p}\n"
+                f"Current duration: {current_duration:.2f} hours"
             )
+        return message, "white"
+
+    def _apply_result(self, result: Tuple[str, Optional[str]]) -> None:
+        """
+        Shows the result of a background hours lookup. Runs on the GUI thread.
+
+        @param result: The message to display and its color
+        """
+        message, color = result
+        self.info_label.setText(message)
+        if color is not None:
+            self._set_color(color)
+
+    def _apply_error(self, error: str) -> None:
+        """
+        Shows an error raised by a background hours lookup.
 
-            if not response.data and not active_session:
-                self.info_label.setText(
-                    f"No hours recorded this week for {member['name']}"
-                )
-                return
-
-            # Calculate current week hours
-            current_week_hours = 0.0
-
-            for session in response.data:
-                # If duration is None, calculate it from sign_in_time to now (active session)
-                duration = session.get("duration")
-                if duration is None:
-                    try:
-                        sign_in_time = datetime.fromisoformat(
-                            session["sign_in_time"].replace("Z", "+00:00")
-                        )
-                        current_time = datetime.now(sign_in_time.tzinfo)
-                        duration = (
-                            current_time - sign_in_time
-                        ).total_seconds() / 3600.0
-                    except (ValueError, TypeError, KeyError) as e:
-                        print(f"Error calculating session duration: {e}")
-                        continue
-
-                try:
-                    current_week_hours += float(duration)
-                except (ValueError, TypeError):
-                    print(f"Invalid duration value in session: {duration}")
-                    continue
-
-            # Add current active session duration if exists
-            current_duration = 0.0
-            if active_session:
-                try:
-                    sign_in_time = datetime.fromisoformat(
-                        active_session["sign_in_time"].replace("Z", "+00:00")
-                    )
-                    current_time = datetime.now(sign_in_time.tzinfo)
-                    current_duration = (
-                        current_time - sign_in_time
-                    ).total_seconds() / 3600.0
-
-                    if sign_in_time >= start_of_week:
-                        current_week_hours += current_duration
-                except (ValueError, TypeError, KeyError) as e:
-                    print(f"Error calculating current session duration: {e}")
-                    current_duration = 0.0
-
-            # Format the display message
-            message_parts = []
-            message_parts.append(f"Member: {member['name']} ({member['position']})")
-            message_parts.append(f"Current Week Hours: {current_week_hours:.2f}")
-
-            if active_session and current_duration > 0:
-                message_parts.append("\nCurrent Session:")
-                message_parts.append(
-                    f"Signed in at: {sign_in_time.strftime('%I:%M %p')}"
-                )
-                message_parts.append(f"Current duration: {current_duration:.2f} hours")
-
-            self.info_label.setText("\n".join(message_parts))
-            self.info_label.setStyleSheet("color: white;")
+        @param error: The error message
+        """
+        self.info_label.setText(f"Error checking hours: {error}")
+        self._set_color("red")
+
+    def _tear_down(self) -> None:
+        """
+        Stops handling card reads and hands focus back to the parent window.
+        Runs once, from whichever of hide or close happens first (reject and
+        Escape hide the dialog without a close event).
+        """
+        if self._torn_down:
+            return
+        self._torn_down = True
+
+        if self.rfid_worker is not None:
+            try:
+                self.rfid_worker.card_detected.disconnect(self.handle_card_tap)
+            except TypeError:
+                pass  # Never connected (initialization failed)
+            if self._owns_worker:
+                self.rfid_worker.stop()
+        # Ensure parent window stays in full screen and focused
+        if self.parent():
+            self.parent().showFullScreen()
+            self.parent().raise_()
+            self.parent().activateWindow()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        """
+        Handle the window hide event.
 
+        @param event: The hide event
+        """
+        super().hideEvent(event)
+        try:
+            self._tear_down()
         except Exception as e:
-            self.info_label.setText(f"Error checking hours: {str(e)}")
-            self.info_label.setStyleSheet("color: red;")
-            print(
-                f"Detailed error in handle_card_tap: {str(e)}"
-            )  # Add detailed logging
+            print(f"Error during cleanup: {str(e)}")
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """
@@ -317,18 +353,7 @@ class CheckHoursWindow(QtWidgets.QDialog):
         @param event: The close event
         """
         try:
-            if hasattr(self, "rfid_reader"):
-                self.rfid_reader.stop_reading()
-            if hasattr(self, "reader_thread"):
-                self.reader_thread.join(timeout=1.0)
-
-            # Ensure parent window stays in full screen and focused
-            if self.parent():
-                self.parent().showFullScreen()
-                self.parent().raise_()
-                self.parent().activateWindow()
-
-            event.accept()
+            self._tear_down()
         except Exception as e:
             print(f"Error during cleanup: {str(e)}")
-            event.accept()  # Still accept the event to ensure window closes
+        event.accept()  # Always accept the event to ensure the window closes
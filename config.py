@@ -2,36 +2,35 @@
 Configuration settings for the attendance system.
 """
 
-from typing import Dict
-
-# Database configuration
-DB_PATH: str = "attendance.db"
-
-# RFID card to user mapping
-USER_MAPPING: Dict[str, str] = {"123456": "Alice", "654321": "Bob"}
-
 # Time settings
 AUTO_SIGNOUT_HOUR: int = 22  # 8:00 PM
 SLEEP_TIME_HOUR: int = 22
 SLEEP_TIME_MINUTE: int = 30  # 8:00 PM
-WAKE_TIME_HOUR: int = 8  # 8:00 AM
-WAKE_TIME_MINUTE: int = 0
 
 # Sign-in start time
 START_TIME_HOUR: int = 7  # 7:00 AM
 START_TIME_MINUTE: int = 0  # 7:00 AM
 
-DEFAULT_DURATION_HOURS: float = 1.0  # Duration assigned for auto sign-out
-
 # UI Settings
-WINDOW_TITLE: str = "ASG Attendance System"
-WINDOW_GEOMETRY: tuple[int, int, int, int] = (
-    100,
-    100,
-    1024,
-    600,
-)  # x, y, width, height
-AUTO_SIGNOUT_CHECK_INTERVAL: int = 60000  # milliseconds (1 minute)
+# ASG logo, and optional copies pre-scaled to a given height in pixels. A
+# window loads the pre-scaled file when one exists for its logo size and
+# only scales LOGO_PATH otherwise.
+LOGO_PATH: str = "assets/ASG.png"
+LOGO_PRESCALED_PATH: str = "assets/ASG_h{}.png"
+
+# RFID reader settings
+# Seconds between reads of the reader
+RFID_POLL_INTERVAL_SECONDS: float = 0.5
+# A card read again within this many seconds of its last read is treated as
+# the same physical tap (e.g. a card held on the reader) and not reported
+RFID_DEBOUNCE_SECONDS: float = 2.0
+
+# How long a member looked up by RFID tag is served from memory (seconds)
+MEMBER_CACHE_TTL_SECONDS: float = 60.0
+# Maximum number of RFID tags kept in the member cache
+MEMBER_CACHE_MAX_SIZE: int = 256
+# How long the list of positions is served from memory (seconds)
+POSITIONS_CACHE_TTL_SECONDS: float = 600.0
 
 # Message display duration in milliseconds (5 seconds)
 MESSAGE_DISPLAY_DURATION: int = 5000
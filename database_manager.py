@@ -6,16 +6,23 @@ Handles all Supabase operations and data persistence.
 
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from dateutil.parser import isoparse
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+import httpx
 from dotenv import load_dotenv
+from postgrest.types import ReturnMethod
 from supabase import create_client, Client
 import config
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Sign-in window bounds as hour * 100 + minute, compared against the clock
+_SIGN_IN_START_HHMM: int = config.START_TIME_HOUR * 100 + config.START_TIME_MINUTE
+_SIGN_IN_END_HHMM: int = config.AUTO_SIGNOUT_HOUR * 100
+
 
 class DatabaseManager:
     """
@@ -35,53 +42,95 @@ class DatabaseManager:
                 )
 
             self.supabase: Client = create_client(url, key)
+
+            # Route every PostgREST call through one persistent HTTP/2 client so
+            # sequential queries on a tap reuse the same TLS connection.
+            postgrest = self.supabase.postgrest
+            default_session = postgrest.session
+            self._http = httpx.Client(
+                base_url=default_session.base_url,
+                headers=default_session.headers,
+                timeout=5.0,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+            )
+            default_session.close()
+            postgrest.session = self._http
+
+            # RFID tag -> (monotonic fetch time, member row) lookaside cache
+            self._rfid_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+            # Monotonic time of the last full member load (see preload_members)
+            self._members_loaded_at: Optional[float] = None
+            # (monotonic fetch time, positions) for get_positions
+            self._positions_cache: Optional[Tuple[float, List[str]]] = None
+
+            # Runs independent queries concurrently over the shared client
+            self._executor = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="db-query"
+            )
         except Exception as error:
             print(f"Database connection error: {error}")
             sys.exit(1)
 
+    def close(self) -> None:
+        """
+        Closes the persistent HTTP connection and the query thread pool.
+        """
+        try:
+            self._executor.shutdown(wait=False)
+            self._http.close()
+        except Exception as error:
+            print(f"Error closing database connection: {error}")
+
+    def _list_first_members(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Calls the list_positions RPC, which deduplicates in Postgres and returns
+        the first non-vacant member of each position ordered by member id.
+
+        @return: Dictionary mapping position to a row with id, position and rfid_tag.
+        """
+        response = self.supabase.rpc("list_positions").execute()
+        return {row["position"]: row for row in response.data or []}
+
     def get_positions(self) -> List[str]:
         """
-        Retrieves unique positions from the asg_members table while preserving
-        the order as returned by the database. Only returns positions for members
-        with a non-empty name (i.e. non-vacant members).
+        Retrieves unique positions from the asg_members table in order of first
+        appearance. Only returns positions for members with a non-empty name
+        (i.e. non-vacant members). Results are cached for
+        config.POSITIONS_CACHE_TTL_SECONDS.
 
         @return: List of unique positions, ordered as they appear in the database.
         """
-        try:
-            # Query the "position" and "name" columns from asg_members.
-            response = (
-                self.supabase.table("asg_members").select("position, name").execute()
-            )
-            if not response.data:
-                return []
-
-            positions: List[str] = []  # List to store unique positions in order
-            seen_positions: set[str] = (
-                set()
-            )  # Set to track positions that have been seen
-
-            # Process each member in the returned data, preserving the original order.
-            for member in response.data:
-                # Validate that the "name" field exists, is not None and is not empty.
-                name: Optional[str] = member.get("name")
-                if name is None or name.strip() == "":
-                    continue  # Skip vacant member records
-
-                # Validate presence of the "position" field.
-                position: Optional[str] = member.get("position")
-                if position is None:
-                    continue
-
-                # Add the position to the result if it hasn't been added yet.
-                if position not in seen_positions:
-                    seen_positions.add(position)
-                    positions.append(position)
-            return positions
+        cached = self._positions_cache
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < config.POSITIONS_CACHE_TTL_SECONDS
+        ):
+            return list(cached[1])
 
+        try:
+            positions = list(self._list_first_members())
+            self._positions_cache = (time.monotonic(), positions)
+            return list(positions)
         except Exception as error:
             print(f"Error fetching positions: {error}")
             return []
 
+    def get_members_by_position(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieves the first non-vacant member of each position in one query,
+        keyed by position in order of first appearance (the same order as
+        get_positions).
+
+        @return: Dictionary mapping position to a row with id, position and rfid_tag.
+        """
+        try:
+            return self._list_first_members()
+        except Exception as error:
+            print(f"Error fetching members by position: {error}")
+            return {}
+
     def update_member(self, member_id: int, data: Dict[str, Any]) -> bool:
         """
         Updates an existing member's information.
@@ -91,32 +140,108 @@ class DatabaseManager:
         @return: True if successful, False otherwise.
         """
         try:
-            response = (
+            # Ask PostgREST not to send the updated row back; failures raise
+            (
                 self.supabase.table("asg_members")
-                .update(data)
+                .update(data, returning=ReturnMethod.minimal)
                 .eq("id", member_id)
                 .execute()
             )
-            return bool(response.data)
+            # Drop cached rows for this member, and any row cached under a tag
+            # it is taking over, so the next lookup sees the update
+            for rfid_tag, (_, member) in list(self._rfid_cache.items()):
+                if member.get("id") == member_id:
+                    self._rfid_cache.pop(rfid_tag, None)
+            if "rfid_tag" in data:
+                self._rfid_cache.pop(data["rfid_tag"], None)
+            if "name" in data or "position" in data:
+                self._positions_cache = None
+            return True
         except Exception as error:
             print(f"Error updating member: {error}")
             return False
 
+    @staticmethod
+    def _add_first_name(member: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adds a "first_name" key to a member row so callers don't split the
+        name on every tap.
+
+        @param member: Member row with a "name" key.
+        @return: The same row.
+        """
+        member["first_name"] = (member.get("name") or "").partition(" ")[0]
+        return member
+
+    def preload_members(self) -> int:
+        """
+        Loads every member with an RFID tag into the lookup cache in a single
+        query, replacing its previous contents.
+
+        @return: Number of members loaded.
+        """
+        try:
+            response = (
+                self.supabase.table("asg_members")
+                .select("id, name, position, rfid_tag")
+                .not_.is_("rfid_tag", "null")
+                .execute()
+            )
+            loaded_at = time.monotonic()
+            self._rfid_cache = {
+                member["rfid_tag"]: (loaded_at, self._add_first_name(member))
+                for member in response.data or []
+            }
+            self._members_loaded_at = loaded_at
+            return len(self._rfid_cache)
+        except Exception as error:
+            print(f"Error preloading members: {error}")
+            return 0
+
     def get_member_by_rfid(self, rfid_tag: str) -> Optional[Dict[str, Any]]:
         """
         Retrieves member information by RFID tag.
+        Results are cached for config.MEMBER_CACHE_TTL_SECONDS; unknown tags
+        are not cached so newly registered cards are picked up immediately.
+        Once preload_members has run, a stale entry refreshes the whole member
+        table in one query rather than fetching members one by one.
 
         @param rfid_tag: The RFID card identifier.
-        @return: Member information if found, None otherwise.
+        @return: Member information (including "first_name") if found, None
+                 otherwise.
         """
+        now = time.monotonic()
+        cached = self._rfid_cache.get(rfid_tag)
+        if cached is not None and now - cached[0] < config.MEMBER_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        if (
+            self._members_loaded_at is not None
+            and now - self._members_loaded_at >= config.MEMBER_CACHE_TTL_SECONDS
+            and self.preload_members()
+        ):
+            cached = self._rfid_cache.get(rfid_tag)
+            return cached[1] if cached is not None else None
+
         try:
             response = (
                 self.supabase.table("asg_members")
-                .select("*")
+                .select("id, name, position, rfid_tag")
                 .eq("rfid_tag", rfid_tag)
+                .limit(1)
+                .maybe_single()
                 .execute()
             )
-            return response.data[0] if response.data else None
+            # Newer postgrest versions return no response at all for no rows
+            member = response.data if response is not None else None
+            if member is not None:
+                self._add_first_name(member)
+                if len(self._rfid_cache) >= config.MEMBER_CACHE_MAX_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._rfid_cache.pop(next(iter(self._rfid_cache)))
+                self._rfid_cache.pop(rfid_tag, None)
+                self._rfid_cache[rfid_tag] = (time.monotonic(), member)
+            return member
         except Exception as error:
             print(f"Error fetching member: {error}")
             return None
@@ -124,6 +249,7 @@ class DatabaseManager:
     def get_active_session(self, member_id: int) -> Optional[Dict[str, Any]]:
         """
         Retrieves an active attendance session for the given member.
+        The row includes the computed sign_in_epoch column (epoch seconds).
 
         @param member_id: The member's ID.
         @return: The active session data or None if no active session exists.
@@ -131,109 +257,117 @@ class DatabaseManager:
         try:
             response = (
                 self.supabase.table("asg_logs")
-                .select("*")
+                .select("id, sign_in_time, sign_in_epoch")
                 .eq("user_id", member_id)
                 .is_("sign_out_time", "null")
+                .limit(1)
+                .maybe_single()
                 .execute()
             )
-            return response.data[0] if response.data else None
+            return response.data if response is not None else None
         except Exception as error:
             print(f"Error fetching active session: {error}")
             return None
 
-    def sign_in(self, rfid_tag: str) -> Optional[Dict[str, Any]]:
+    def get_week_hours(self, member_id: int, since: datetime) -> float:
+        """
+        Retrieves the total hours of completed sessions for a member since the
+        given timestamp. The sum is computed server-side by the week_hours RPC.
+
+        @param member_id: The member's ID.
+        @param since: Timezone-aware datetime marking the start of the period.
+        @return: Total completed hours, or 0.0 if none were found.
+        """
+        try:
+            response = self.supabase.rpc(
+                "week_hours", {"uid": member_id, "since": since.isoformat()}
+            ).execute()
+            return float(response.data or 0.0)
+        except Exception as error:
+            print(f"Error fetching week hours: {error}")
+            return 0.0
+
+    def get_hours_summary(
+        self, member_id: int, since: datetime
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Retrieves a member's active session and completed hours since the given
+        timestamp. The two queries are independent, so they run concurrently
+        and the call costs one round-trip instead of two.
+
+        @param member_id: The member's ID.
+        @param since: Timezone-aware datetime marking the start of the period.
+        @return: Tuple of (active session or None, total completed hours).
+        """
+        session_future = self._executor.submit(self.get_active_session, member_id)
+        hours = self.get_week_hours(member_id, since)
+        return session_future.result(), hours
+
+    def sign_in(
+        self, rfid_tag: str, member_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Records a sign in event for the given member.
         Only allows sign-in between 7:30 AM and 7:00 PM.
 
         @param rfid_tag: The RFID card identifier.
+        @param member_id: Optional member ID already resolved from the tag;
+                          skips the lookup by RFID tag when given.
         @return: The log entry if successful, None otherwise.
         """
         try:
-            # Check if it's before 7:30 AM or after 7:00 PM (bypass in DEV mode)
-            current_time = datetime.now()
+            # Reject sign-ins outside the allowed window (bypass in DEV mode)
             if not config.DEV_MODE:
-                # Check if it's before start time (7:30 AM)
-                if current_time.hour < config.START_TIME_HOUR or (
-                    current_time.hour == config.START_TIME_HOUR
-                    and current_time.minute < config.START_TIME_MINUTE
-                ):
-                    print("Sign-in rejected: Before 7:30 AM")
+                current_time = datetime.now()
+                hhmm = current_time.hour * 100 + current_time.minute
+                if hhmm < _SIGN_IN_START_HHMM:
+                    print("Sign-in rejected: Before start time")
                     return {"error": "before_hours"}
-
-                # Check if it's after end time (7:00 PM)
-                if current_time.hour >= config.AUTO_SIGNOUT_HOUR:
-                    print("Sign-in rejected: After 7:00 PM")
+                if hhmm >= _SIGN_IN_END_HHMM:
+                    print("Sign-in rejected: After end time")
                     return {"error": "after_hours"}
 
-            # Retrieve the member using the provided RFID tag.
-            member = self.get_member_by_rfid(rfid_tag)
-            if not member:
-                print(f"Unknown RFID tag: {rfid_tag}")
+            # Look up the member, mark them in the office and insert the sign
+            # in log in a single round-trip (see sql/0007_one_open_session.sql
+            # and sql/0010_sign_in_out_member.sql).
+            if member_id is not None:
+                rpc = self.supabase.rpc("sign_in_member", {"uid": member_id})
+            else:
+                rpc = self.supabase.rpc("sign_in_rfid", {"tag": rfid_tag})
+            response = rpc.execute()
+            if not response.data:
+                print(f"Unknown RFID tag or session already open: {rfid_tag}")
                 return None
-
-            # Generate the current UTC time in ISO format.
-            now_iso = datetime.now(timezone.utc).isoformat()
-            log_data = {
-                "message": f"{member['name'].split(' ')[0]} Signed In",
-                "user_id": member["id"],
-                "sign_in_time": now_iso,
-            }
-
-            # Mark the member as in the office by setting inoffice to True.
-            self.update_member(member["id"], {"inoffice": True})
-
-            # Insert log entry for sign in.
-            response = self.supabase.table("asg_logs").insert(log_data).execute()
-            return response.data[0] if response.data else None
+            return response.data[0]
         except Exception as error:
             print(f"Error during sign in: {error}")
             return None
 
-    def sign_out(self, rfid_tag: str) -> Optional[float]:
+    def sign_out(
+        self, rfid_tag: str, member_id: Optional[int] = None
+    ) -> Optional[float]:
         """
         Records a sign out event for the given member.
 
         :param rfid_tag: The RFID card identifier.
+        :param member_id: Optional member ID already resolved from the tag;
+                          skips the lookup by RFID tag when given.
         :return: Duration in hours if successful, None otherwise.
         """
         try:
-            # Retrieve the member based on the RFID tag.
-            member: Optional[Dict[str, Any]] = self.get_member_by_rfid(rfid_tag)
-            if member is None:
-                print(f"Member not found for RFID tag: {rfid_tag}")
+            # Close the active session, compute its duration and mark the
+            # member out of the office in a single round-trip. The RPC returns
+            # just the duration (see sql/0009_sign_out_duration.sql and
+            # sql/0010_sign_in_out_member.sql).
+            if member_id is not None:
+                rpc = self.supabase.rpc("sign_out_member", {"uid": member_id})
+            else:
+                rpc = self.supabase.rpc("sign_out_rfid", {"tag": rfid_tag})
+            response = rpc.execute()
+            if response.data is None:
+                print(f"No active session found for RFID tag: {rfid_tag}")
                 return None
-
-            # Retrieve the active session for this member.
-            active_session: Optional[Dict[str, Any]] = self.get_active_session(
-                member["id"]
-            )
-            if active_session is None:
-                print(f"No active session found for member ID: {member['id']}")
-                return None
-
-            # Parse the sign in time using isoparse for robust ISO8601 parsing.
-            sign_in_time: datetime = isoparse(active_session["sign_in_time"])
-            sign_out_time: datetime = datetime.now(timezone.utc)
-            duration_hours: float = (
-                sign_out_time - sign_in_time
-            ).total_seconds() / 3600.0
-
-            # Prepare the update payload for the sign out event.
-            update_data: Dict[str, Any] = {
-                "sign_out_time": sign_out_time.isoformat(),
-                "duration": duration_hours,
-                "message": f"{member['name'].split(' ')[0]} Signed Out",
-            }
-
-            # Update the sign out event in the asg_logs table.
-            self.supabase.table("asg_logs").update(update_data).eq(
-                "id", active_session["id"]
-            ).execute()
-
-            # Mark the member as no longer in the office.
-            self.update_member(member["id"], {"inoffice": False})
-            return duration_hours
+            return float(response.data)
         except Exception as error:
             print(f"Error during sign out: {error}")
             return None
@@ -245,48 +379,13 @@ class DatabaseManager:
         Sets duration to 0 if sign-in time is less than an hour ago.
         """
         try:
-            # Retrieve all members currently in the office.
-            response = (
-                self.supabase.table("asg_members")
-                .select("*")
-                .eq("inoffice", True)
-                .execute()
-            )
-            if not response.data:
-                return
-
-            now = datetime.now(timezone.utc)
-            signed_out_members = []  # Track members who were signed out
-
-            for member in response.data:
-                active_session = self.get_active_session(member["id"])
-                if active_session:
-                    # Calculate time difference
-                    sign_in_time = isoparse(active_session["sign_in_time"])
-                    time_diff = (
-                        now - sign_in_time
-                    ).total_seconds() / 3600.0  # Convert to hours
-
-                    # Set duration based on time difference
-                    duration = 0.0 if time_diff < 1.0 else 1.0
-
-                    # Prepare update data for auto sign-out
-                    update_data = {
-                        "sign_out_time": now.isoformat(),
-                        "duration": duration,
-                        "message": f"{member['name'].split(' ')[0]} Automatically signed out.",
-                    }
-                    self.supabase.table("asg_logs").update(update_data).eq(
-                        "id", active_session["id"]
-                    ).execute()
-
-                    # Update member status to mark them as signed out
-                    self.update_member(member["id"], {"inoffice": False})
-
-                    # Add to the list of signed out members
-                    signed_out_members.append(
-                        f"{member['name']} ({member['position']})"
-                    )
+            # Close every open session and mark everyone out of the office in
+            # a single round-trip (see sql/0008_auto_sign_out.sql).
+            response = self.supabase.rpc("auto_sign_out").execute()
+            signed_out_members = [
+                f"{member['name']} ({member['position']})"
+                for member in response.data or []
+            ]
 
             # Return the list of signed out members for logging
             if signed_out_members:
@@ -322,6 +421,23 @@ class DatabaseManager:
             return False
 
 
+# Shared by every window so they reuse one client, connection pool and cache
+_db_manager: Optional[DatabaseManager] = None
+
+
+def get_db_manager() -> DatabaseManager:
+    """
+    Returns the process-wide DatabaseManager, creating it on first use.
+    Call from the GUI thread; the instance is then safe to use from workers.
+
+    @return: The shared DatabaseManager.
+    """
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
+
+
 if __name__ == "__main__":
     # Example test execution: Initialize DatabaseManager and print unique positions.
     db_manager = DatabaseManager()
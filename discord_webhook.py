@@ -4,11 +4,12 @@ Discord webhook handler for sending attendance notifications.
 Provides functionality to send tap in/out notifications to a Discord channel.
 """
 
-import json
-from datetime import datetime
-from typing import Dict, Optional, Union, List
-import requests
 import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union, Tuple
+import httpx
 
 
 class DiscordWebhook:
@@ -18,21 +19,42 @@ class DiscordWebhook:
     """
 
     # Collection of meme GIFs for special members
-    PRESIDENT_MEMES: List[str] = [
+    PRESIDENT_MEMES: Tuple[str, ...] = (
         "https://media.giphy.com/media/3o7TKF1fSIs1R19B8k/giphy.gif",  # Cool entrance
         "https://media.giphy.com/media/l0IykG0AM7911MrCM/giphy.gif",  # Boss entrance
         "https://media.giphy.com/media/3o7qE1YN7aBOFPRw8E/giphy.gif",  # Like a boss
         "https://media.giphy.com/media/l46C93LNM33JJ1SMw/giphy.gif",  # Epic entrance
         "https://media.giphy.com/media/xT0BKqxuUDfosKEXXG/giphy.gif",  # Cool guy
-    ]
+    )
 
-    YAPPER_MEMES: List[str] = [
+    YAPPER_MEMES: Tuple[str, ...] = (
         "https://media.giphy.com/media/l0HlMWkHJKvNv6B8Y/giphy.gif",  # Funny entrance
         "https://media.giphy.com/media/26n6R5HOYPbekK0YE/giphy.gif",  # Happy dance
         "https://media.giphy.com/media/26tP24Yd1GznbcXkI/giphy.gif",  # Cool moves
         "https://media.giphy.com/media/26gsjCZpPolPr3sBy/giphy.gif",  # Fun vibes
         "https://media.giphy.com/media/26ufq9mryvc5HI27m/giphy.gif",  # Party time
-    ]
+    )
+
+    # Name fragment -> special formatting, built once and shared by every tap
+    SPECIAL_MEMBERS: Dict[str, Dict[str, Union[str, Tuple[str, ...]]]] = {
+        "Movses": {
+            "display_name": "President Movies",
+            "memes": PRESIDENT_MEMES,
+            "title_emoji": "👑",
+        },
+        "Moises": {
+            "display_name": "President Movies second Son / Yapper",
+            "memes": YAPPER_MEMES,
+            "title_emoji": "🎭",
+        },
+    }
+    _SPECIAL_RE = re.compile("|".join(map(re.escape, SPECIAL_MEMBERS)))
+
+    # Event type -> (title word, embed color); green for in, red for out
+    _EVENT_STYLES: Dict[str, Tuple[str, int]] = {
+        "in": ("In", 0x00FF00),
+        "out": ("Out", 0xFF0000),
+    }
 
     def __init__(self, webhook_url: str) -> None:
         """
@@ -42,28 +64,50 @@ class DiscordWebhook:
         """
         self.webhook_url = webhook_url
 
+        # Posts run on one background thread over a persistent keep-alive
+        # connection so taps never wait on Discord.
+        self._http = httpx.Client(
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="discord-webhook"
+        )
+
+    def close(self) -> None:
+        """
+        Waits for queued notifications and closes the HTTP connection.
+        """
+        self._executor.shutdown(wait=True)
+        self._http.close()
+
+    def _post(self, payload: Dict[str, Any]) -> bool:
+        """
+        Sends a payload to the webhook. Runs on the background thread.
+
+        @param payload: The webhook payload
+        @return: True if Discord accepted the message, False otherwise
+        """
+        try:
+            # httpx serializes the payload and sets the JSON content type
+            response = self._http.post(self.webhook_url, json=payload)
+            return response.status_code == 204
+        except Exception as error:
+            print(f"Error sending Discord notification: {error}")
+            return False
+
     def _get_special_member_info(
         self, member_name: str
-    ) -> Optional[Dict[str, Union[str, List[str]]]]:
+    ) -> Optional[Dict[str, Union[str, Tuple[str, ...]]]]:
         """
         Get special formatting for specific members.
 
         @param member_name: Name of the member
         @return: Dictionary with special member info if applicable, None otherwise
         """
-        if "Movses" in member_name:
-            return {
-                "display_name": "President Movies",
-                "memes": self.PRESIDENT_MEMES,
-                "title_emoji": "👑",
-            }
-        elif "Moises" in member_name:
-            return {
-                "display_name": "President Movies second Son / Yapper",
-                "memes": self.YAPPER_MEMES,
-                "title_emoji": "🎭",
-            }
-        return None
+        match = self._SPECIAL_RE.search(member_name)
+        return self.SPECIAL_MEMBERS[match.group()] if match else None
 
     def send_tap_notification(
         self,
@@ -71,23 +115,30 @@ class DiscordWebhook:
         position: str,
         event_type: str,
         duration: Optional[float] = None,
+        tapped_at: Optional[datetime] = None,
     ) -> bool:
         """
-        Send a tap in/out notification to Discord.
+        Queue a tap in/out notification to Discord. Returns immediately; the
+        request is sent on a background thread.
 
         @param member_name: Name of the member
         @param position: Position/role of the member
         @param event_type: Type of event ("in" or "out")
         @param duration: Optional duration in hours for tap out events
-        @return: True if notification was sent successfully, False otherwise
+        @param tapped_at: Optional timezone-aware time of the event; defaults to now
+        @return: True if the notification was queued, False otherwise
         """
         try:
             # Validate event type
-            if event_type not in ["in", "out"]:
+            event_style = self._EVENT_STYLES.get(event_type)
+            if event_style is None:
                 raise ValueError("Event type must be either 'in' or 'out'")
+            event_title, event_color = event_style
 
-            # Create the embed for the notification
-            current_time = datetime.now().strftime("%I:%M %p")
+            # Read the clock once for both the local time field and the timestamp
+            if tapped_at is None:
+                tapped_at = datetime.now(timezone.utc)
+            current_time = tapped_at.astimezone().strftime("%I:%M %p")
 
             # Check for special member handling
             special_member = self._get_special_member_info(member_name)
@@ -100,24 +151,27 @@ class DiscordWebhook:
                 title_emoji = "🎯"
                 random_meme = None
 
-            embed: Dict[str, Union[str, int]] = {
-                "title": f"{title_emoji} Member Tap {event_type.title()} {title_emoji}",
-                "description": f"**{display_name}** ({position})",
-                "color": (
-                    0x00FF00 if event_type == "in" else 0xFF0000
-                ),  # Green for in, Red for out
-                "timestamp": datetime.utcnow().isoformat(),
-                "fields": [{"name": "Time", "value": current_time, "inline": True}],
-            }
+            time_field = {"name": "Time", "value": current_time, "inline": True}
 
             # Add duration field for tap out events
             if event_type == "out" and duration is not None:
                 hours = int(duration)
                 minutes = int((duration - hours) * 60)
                 duration_str = f"{hours}h {minutes}m"
-                embed["fields"].append(
-                    {"name": "Duration", "value": duration_str, "inline": True}
-                )
+                fields = [
+                    time_field,
+                    {"name": "Duration", "value": duration_str, "inline": True},
+                ]
+            else:
+                fields = [time_field]
+
+            embed: Dict[str, Any] = {
+                "title": f"{title_emoji} Member Tap {event_title} {title_emoji}",
+                "description": f"**{display_name}** ({position})",
+                "color": event_color,
+                "timestamp": tapped_at.isoformat(),
+                "fields": fields,
+            }
 
             # Add meme GIF for special members
             if random_meme:
@@ -126,16 +180,9 @@ class DiscordWebhook:
             # Prepare the webhook payload
             payload = {"embeds": [embed]}
 
-            # Send the webhook request
-            response = requests.post(
-                self.webhook_url,
-                data=json.dumps(payload),
-                headers={"Content-Type": "application/json"},
-                timeout=5,
-            )
-
-            # Check if the request was successful
-            return response.status_code == 204
+            # Send the webhook request in the background
+            self._executor.submit(self._post, payload)
+            return True
 
         except Exception as error:
             print(f"Error sending Discord notification: {error}")
@@ -4,6 +4,7 @@ Main entry point for the Attendance Sign In/Sign Out System.
 Initializes the PyQt application and starts the UI.
 """
 
+import logging
 import sys
 from PyQt5 import QtWidgets
 from ui import AttendanceApp
@@ -14,6 +15,11 @@ def main() -> None:
     Main entry point for the application.
     Initializes and starts the PyQt application.
     """
+    # Warnings and above only, so debug calls on the tap path cost no I/O
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s %(name)s %(levelname)s: %(message)s",
+    )
     app = QtWidgets.QApplication(sys.argv)
     attendance_app = AttendanceApp()
     attendance_app.show()
@@ -4,11 +4,148 @@ RFID card registration window module.
 Handles the registration of RFID cards to ASG positions.
 """
 
-from typing import Optional, Dict, Any
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from PyQt5 import QtWidgets, QtCore, QtGui
-from database_manager import DatabaseManager
+
+import config
+from database_manager import get_db_manager
 from rfid_reader import RFIDReader
-from threading import Thread
+from rfid_worker import RFIDWorker
+from workers import Worker
+
+log = logging.getLogger("asg.registration")
+
+# QPixmapCache key for the logo scaled to a given size, shared with the main
+# window (QPixmap is implicitly shared, so reusing one is a cheap reference copy)
+_LOGO_CACHE_KEY = "asg_logo_{}"
+# Logos within this fraction of the target size are scaled without smoothing
+_LOGO_FAST_SCALE_TOLERANCE = 0.1
+
+# Stylesheets are built once at import and shared by every window instance
+_DIALOG_QSS = """
+QDialog {
+    background-color: black;
+    color: white;
+}
+QLabel, QCheckBox, QPushButton, QComboBox {
+    color: white;
+}
+"""
+
+_HEADER_QSS = """
+QWidget {
+    background: qlineargradient(
+        x1: 0, y1: 0, x2: 0, y2: 1,
+        stop: 0 rgba(0, 0, 0, 0.8),
+        stop: 1 rgba(0, 0, 0, 0.3)
+    );
+    border-radius: 15px;
+    padding: 20px;
+}
+"""
+
+_CONTENT_QSS = """
+QWidget {
+    background: rgba(255, 255, 255, 0.05);
+    border-radius: 15px;
+    padding: 20px;
+}
+QComboBox {
+    background-color: rgba(255, 255, 255, 0.1);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 5px;
+    padding: 10px;
+    color: white;
+    min-height: 40px;
+}
+QComboBox::drop-down {
+    border: none;
+    width: 30px;
+}
+QComboBox::down-arrow {
+    border: 2px solid white;
+    width: 8px;
+    height: 8px;
+    background: transparent;
+    border-width: 0 2px 2px 0;
+    transform: rotate(45deg);
+    margin-top: -5px;
+}
+QComboBox QAbstractItemView {
+    background-color: rgb(30, 30, 30);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 5px;
+    selection-background-color: rgba(255, 255, 255, 0.2);
+    selection-color: white;
+    color: white;
+    outline: none;
+    padding: 5px;
+}
+QPushButton {
+    background-color: rgba(255, 255, 255, 0.1);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 5px;
+    padding: 15px 30px;
+    color: white;
+    min-width: 200px;
+}
+QPushButton:hover {
+    background-color: rgba(255, 255, 255, 0.2);
+}
+QCheckBox {
+    color: white;
+    padding: 10px;
+}
+QCheckBox::indicator {
+    width: 20px;
+    height: 20px;
+}
+QLabel[status="ok"] {
+    color: green;
+}
+QLabel[status="error"] {
+    color: red;
+}
+"""
+
+
+class _UiMetrics(NamedTuple):
+    """Screen-size dependent fonts and spacing for the registration window."""
+
+    margin: int
+    logo_size: int
+    title_font: QtGui.QFont
+    label_font: QtGui.QFont
+    checkbox_font: QtGui.QFont
+    button_font: QtGui.QFont
+    footer_font: QtGui.QFont
+
+
+@lru_cache(maxsize=1)
+def _compute_metrics(width: int, height: int) -> _UiMetrics:
+    """
+    Builds the window's fonts and spacing for a screen size. Cached, so
+    reopening the window on the same screen reuses the same QFont objects.
+
+    @param width: Screen width in pixels
+    @param height: Screen height in pixels
+    @return: The metrics for that screen size
+    """
+    label_size = int(height * 0.03)  # 3% of screen height
+    footer_font = QtGui.QFont("Arial", int(height * 0.015))
+    footer_font.setItalic(True)
+    return _UiMetrics(
+        margin=int(min(width, height) * 0.02),
+        logo_size=int(height * 0.08),  # 8% of screen height
+        title_font=QtGui.QFont("Arial", int(height * 0.05), QtGui.QFont.Bold),
+        label_font=QtGui.QFont("Arial", label_size),
+        checkbox_font=QtGui.QFont("Arial", int(label_size * 0.8)),
+        button_font=QtGui.QFont("Arial", int(height * 0.025)),  # 2.5% of height
+        footer_font=footer_font,
+    )
 
 
 class RegistrationWindow(QtWidgets.QDialog):
@@ -17,64 +154,56 @@ class RegistrationWindow(QtWidgets.QDialog):
     Provides a user interface for assigning RFID cards to positions.
     """
 
-    # Define a custom signal for RFID card detection.
-    card_detected = QtCore.pyqtSignal(str)
-
     def __init__(
         self,
         parent: Optional[QtWidgets.QWidget] = None,
-        rfid_reader: Optional[RFIDReader] = None,
+        rfid_worker: Optional[RFIDWorker] = None,
     ) -> None:
         """
         Initialize the registration window with necessary components.
 
         @param parent: Optional parent widget.
-        @param rfid_reader: Optional existing RFID reader instance.
+        @param rfid_worker: Optional shared RFID worker thread; a private one is
+                            created and stopped on close when omitted.
         """
         super().__init__(parent)
-        self.rfid_reader = rfid_reader  # Store the RFID reader first
+        self.rfid_worker = rfid_worker
+        self._owns_worker = rfid_worker is None
+        self._torn_down = False  # Set once _tear_down has run
 
         # Set window properties for full screen
         self.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.FramelessWindowHint)
         self.setWindowState(QtCore.Qt.WindowFullScreen)
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: black;
-                color: white;
-            }
-            QLabel, QCheckBox, QPushButton, QComboBox {
-                color: white;
-            }
-        """
-        )
+        self.setStyleSheet(_DIALOG_QSS)
 
         try:
             # Initialize components
-            self.db_manager = DatabaseManager()
-            if self.rfid_reader is None:
-                self.rfid_reader = RFIDReader()
+            self.db_manager = get_db_manager()
+            if self.rfid_worker is None:
+                self.rfid_worker = RFIDWorker(RFIDReader(), self)
             self.current_rfid: Optional[str] = None
-            self.positions = self.db_manager.get_positions()
-
-            if not self.positions:
-                self._show_error_and_close("No positions retrieved from the database.")
-                return
+            # Position -> member row, loaded once (off the GUI thread) and
+            # reused for every tap; filled in by _on_members_loaded
+            self._members_by_position: Dict[str, Dict[str, Any]] = {}
+            self.positions: List[str] = []
 
             self.setup_ui()
 
+            # Show the window straight away and load positions in the background
+            self.position_combo.setEnabled(False)
+            self.register_btn.setEnabled(False)
+            worker = Worker(self.db_manager.get_members_by_position)
+            worker.signals.finished.connect(self._on_members_loaded)
+            worker.signals.error.connect(self._show_error_and_close)
+            QtCore.QThreadPool.globalInstance().start(worker)
+
         except Exception as e:
             self._show_error_and_close(f"Failed to initialize components: {str(e)}")
             return
 
-        # Start RFID reader
+        # Start RFID reader (no-op when the shared worker is already running)
         try:
-            self.reader_thread = Thread(
-                target=self.rfid_reader.start_reading,
-                args=(self._on_card_detected,),
-                daemon=True,
-            )
-            self.reader_thread.start()
+            self.rfid_worker.start()
         except Exception as e:
             self._show_error_and_close(f"Failed to start RFID reader: {str(e)}")
             return
@@ -89,32 +218,18 @@ class RegistrationWindow(QtWidgets.QDialog):
         screen = QtWidgets.QApplication.primaryScreen()
         screen_size = screen.size()
 
-        # Calculate base font sizes based on screen height
-        title_size = int(screen_size.height() * 0.05)  # 5% of screen height
-        label_size = int(screen_size.height() * 0.03)  # 3% of screen height
-        button_size = int(screen_size.height() * 0.025)  # 2.5% of screen height
+        # Fonts and spacing derived from the screen size (computed once)
+        metrics = _compute_metrics(screen_size.width(), screen_size.height())
 
         # Create main layout
         main_layout = QtWidgets.QVBoxLayout(self)
-        margin = int(min(screen_size.width(), screen_size.height()) * 0.02)
+        margin = metrics.margin
         main_layout.setContentsMargins(margin, margin, margin, margin)
         main_layout.setSpacing(margin)
 
         # Header container with gradient background
         header_container = QtWidgets.QWidget()
-        header_container.setStyleSheet(
-            """
-            QWidget {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 rgba(0, 0, 0, 0.8),
-                    stop: 1 rgba(0, 0, 0, 0.3)
-                );
-                border-radius: 15px;
-                padding: 20px;
-            }
-        """
-        )
+        header_container.setStyleSheet(_HEADER_QSS)
         header_layout = QtWidgets.QVBoxLayout(header_container)
 
         # Title container for logo and text
@@ -125,14 +240,29 @@ class RegistrationWindow(QtWidgets.QDialog):
 
         # Add logo
         logo_label = QtWidgets.QLabel(self)
-        logo_size = int(screen_size.height() * 0.08)  # 8% of screen height
-        logo_pixmap = QtGui.QPixmap("assets/ASG.png")
-        scaled_pixmap = logo_pixmap.scaled(
-            logo_size,
-            logo_size,
-            QtCore.Qt.KeepAspectRatio,
-            QtCore.Qt.SmoothTransformation,
-        )
+        logo_size = metrics.logo_size
+        cache_key = _LOGO_CACHE_KEY.format(logo_size)
+        scaled_pixmap = QtGui.QPixmapCache.find(cache_key)
+        if scaled_pixmap is None:
+            prescaled_path = config.LOGO_PRESCALED_PATH.format(logo_size)
+            if os.path.exists(prescaled_path):
+                scaled_pixmap = QtGui.QPixmap(prescaled_path)
+            else:
+                logo_pixmap = QtGui.QPixmap(config.LOGO_PATH)
+                # Nearest-neighbour is visually identical when the asset is
+                # already close to the target size; only pay for smoothing on
+                # big resizes
+                source_size = max(logo_pixmap.width(), logo_pixmap.height(), 1)
+                size_error = abs(source_size - logo_size) / logo_size
+                transform = (
+                    QtCore.Qt.FastTransformation
+                    if size_error <= _LOGO_FAST_SCALE_TOLERANCE
+                    else QtCore.Qt.SmoothTransformation
+                )
+                scaled_pixmap = logo_pixmap.scaled(
+                    logo_size, logo_size, QtCore.Qt.KeepAspectRatio, transform
+                )
+            QtGui.QPixmapCache.insert(cache_key, scaled_pixmap)
         logo_label.setPixmap(scaled_pixmap)
         logo_label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
         title_layout.addWidget(logo_label)
@@ -140,8 +270,7 @@ class RegistrationWindow(QtWidgets.QDialog):
         # Title
         title_label = QtWidgets.QLabel("RFID Card Registration", self)
         title_label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
-        title_font = QtGui.QFont("Arial", title_size, QtGui.QFont.Bold)
-        title_label.setFont(title_font)
+        title_label.setFont(metrics.title_font)
         title_layout.addWidget(title_label)
 
         # Add the title container to the header
@@ -152,82 +281,23 @@ class RegistrationWindow(QtWidgets.QDialog):
 
         # Content container
         content_container = QtWidgets.QWidget()
-        content_container.setStyleSheet(
-            """
-            QWidget {
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 15px;
-                padding: 20px;
-            }
-            QComboBox {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 5px;
-                padding: 10px;
-                color: white;
-                min-height: 40px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox::down-arrow {
-                border: 2px solid white;
-                width: 8px;
-                height: 8px;
-                background: transparent;
-                border-width: 0 2px 2px 0;
-                transform: rotate(45deg);
-                margin-top: -5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: rgb(30, 30, 30);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 5px;
-                selection-background-color: rgba(255, 255, 255, 0.2);
-                selection-color: white;
-                color: white;
-                outline: none;
-                padding: 5px;
-            }
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 5px;
-                padding: 15px 30px;
-                color: white;
-                min-width: 200px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-            QCheckBox {
-                color: white;
-                padding: 10px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-            }
-        """
-        )
+        content_container.setStyleSheet(_CONTENT_QSS)
         content_layout = QtWidgets.QVBoxLayout(content_container)
         content_layout.setSpacing(margin * 2)
 
         # Position selection
         position_label = QtWidgets.QLabel("Select Position:", self)
-        position_label.setFont(QtGui.QFont("Arial", label_size))
+        position_label.setFont(metrics.label_font)
         content_layout.addWidget(position_label)
 
         self.position_combo = QtWidgets.QComboBox()
-        self.position_combo.setFont(QtGui.QFont("Arial", label_size))
-        for position in self.positions:
-            self.position_combo.addItem(position, position)
+        self.position_combo.setFont(metrics.label_font)
+        self.position_combo.addItem("Loading positions...")
         content_layout.addWidget(self.position_combo)
 
         # RFID status
         self.rfid_label = QtWidgets.QLabel("Tap an RFID card to register...", self)
-        self.rfid_label.setFont(QtGui.QFont("Arial", label_size))
+        self.rfid_label.setFont(metrics.label_font)
         self.rfid_label.setAlignment(QtCore.Qt.AlignCenter)
         self.rfid_label.setStyleSheet("padding: 20px;")
         content_layout.addWidget(self.rfid_label)
@@ -236,7 +306,7 @@ class RegistrationWindow(QtWidgets.QDialog):
         self.override_checkbox = QtWidgets.QCheckBox(
             "Override lost card registration", self
         )
-        self.override_checkbox.setFont(QtGui.QFont("Arial", int(label_size * 0.8)))
+        self.override_checkbox.setFont(metrics.checkbox_font)
         content_layout.addWidget(self.override_checkbox)
 
         # Buttons
@@ -247,8 +317,8 @@ class RegistrationWindow(QtWidgets.QDialog):
         self.register_btn = QtWidgets.QPushButton("Register")
         self.cancel_btn = QtWidgets.QPushButton("Cancel")
 
-        for btn in [self.register_btn, self.cancel_btn]:
-            btn.setFont(QtGui.QFont("Arial", button_size))
+        for btn in (self.register_btn, self.cancel_btn):
+            btn.setFont(metrics.button_font)
             button_layout.addWidget(btn)
 
         content_layout.addWidget(button_container)
@@ -261,9 +331,7 @@ class RegistrationWindow(QtWidgets.QDialog):
         footer_layout.setAlignment(QtCore.Qt.AlignRight)
 
         footer_label = QtWidgets.QLabel("powered by Dash Technology", self)
-        footer_font = QtGui.QFont("Arial", int(screen_size.height() * 0.015))
-        footer_font.setItalic(True)
-        footer_label.setFont(footer_font)
+        footer_label.setFont(metrics.footer_font)
         footer_label.setStyleSheet("color: rgba(255, 255, 255, 0.5);")
         footer_layout.addWidget(footer_label)
 
@@ -277,7 +345,7 @@ class RegistrationWindow(QtWidgets.QDialog):
         # Connect signals
         self.register_btn.clicked.connect(self.register_card)
         self.cancel_btn.clicked.connect(self.close)
-        self.card_detected.connect(self.handle_card_tap)
+        self.rfid_worker.card_detected.connect(self.handle_card_tap)
 
     def _show_error_and_close(self, message: str) -> None:
         """
@@ -288,15 +356,57 @@ class RegistrationWindow(QtWidgets.QDialog):
         QtWidgets.QMessageBox.critical(self, "Error", message)
         self.reject()
 
-    def _on_card_detected(self, card_id: str) -> None:
+    def _on_members_loaded(self, members: Dict[str, Dict[str, Any]]) -> None:
         """
-        Callback function invoked when an RFID card is detected.
+        Fills the position list once the members have been loaded.
 
-        @param card_id: The detected RFID card identifier.
+        @param members: Dictionary mapping position to member row.
         """
-        if card_id:
-            self.card_detected.emit(card_id)
+        if not members:
+            self._show_error_and_close("No positions retrieved from the database.")
+            return
+
+        self._members_by_position = members
+        self.positions = list(members)
+
+        # Insert every position in one model update instead of one per item
+        self.position_combo.blockSignals(True)
+        self.position_combo.clear()
+        self.position_combo.addItems(self.positions)
+        self.position_combo.blockSignals(False)
+        self.position_combo.setEnabled(True)
+        self.register_btn.setEnabled(True)
+
+    def _release_reader(self) -> None:
+        """
+        Stops routing card reads to this window, and stops the worker thread
+        if this window created it. Safe to call more than once.
+        """
+        if self.rfid_worker is None:
+            return
+        try:
+            self.rfid_worker.card_detected.disconnect(self.handle_card_tap)
+        except TypeError:
+            pass  # Already disconnected or never connected
+        if self._owns_worker:
+            self.rfid_worker.stop()
+
+    def _set_status(self, text: str, status: str) -> None:
+        """
+        Updates the RFID status label. The color comes from the status
+        property selectors in _CONTENT_QSS, so changing it re-polishes the
+        label against the cached rules instead of parsing a new stylesheet.
 
+        @param text: The status message.
+        @param status: "ok" or "error".
+        """
+        self.rfid_label.setText(text)
+        if self.rfid_label.property("status") != status:
+            self.rfid_label.setProperty("status", status)
+            self.rfid_label.style().unpolish(self.rfid_label)
+            self.rfid_label.style().polish(self.rfid_label)
+
+    @QtCore.pyqtSlot(str)
     def handle_card_tap(self, rfid_tag: str) -> None:
         """
         Processes a tap event from the RFID reader.
@@ -304,171 +414,234 @@ class RegistrationWindow(QtWidgets.QDialog):
 
         @param rfid_tag: The RFID card identifier.
         """
-        try:
-            # Check if the card is already registered.
-            existing_member = self.db_manager.get_member_by_rfid(rfid_tag)
-            if existing_member and not self.override_checkbox.isChecked():
-                QtWidgets.QMessageBox.warning(
-                    self,
-                    "Card Already Registered",
-                    f"This card is already registered to position: {existing_member['position']}",
-                )
-                return
-            elif existing_member and self.override_checkbox.isChecked():
-                # Inform user about override.
-                print(
-                    f"Override enabled: proceeding with registration for card {rfid_tag} despite existing registration."
-                )
+        if not rfid_tag:
+            return
 
-            self.current_rfid = rfid_tag
-            self.rfid_label.setText(f"Card detected: {rfid_tag}")
-            self.rfid_label.setStyleSheet("color: green")
-        except Exception as e:
-            self.rfid_label.setText(f"Error reading card: {str(e)}")
-            self.rfid_label.setStyleSheet("color: red")
+        # Ignore taps until _on_members_loaded has run, so no card is accepted
+        # before the position list (and the register button) is available
+        if not self.positions:
+            self._set_status("Loading positions, please tap again.", "error")
+            return
+
+        # In override mode an existing registration is overwritten anyway, so
+        # accept the card without checking who holds it
+        if self.override_checkbox.isChecked():
+            self._accept_card(rfid_tag)
+            return
+
+        # Check off the GUI thread whether the card is already registered to
+        # any member; registered cards are answered from the member cache
+        self._start_task(self._find_card_owner, self._on_card_checked, rfid_tag)
+
+    def _find_card_owner(self, rfid_tag: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Looks up the member a card is registered to. Runs off the GUI thread.
+
+        @param rfid_tag: The RFID card identifier.
+        @return: The card and its member, or None if it is not registered.
+        """
+        return rfid_tag, self.db_manager.get_member_by_rfid(rfid_tag)
+
+    def _on_card_checked(self, result: Tuple[str, Optional[Dict[str, Any]]]) -> None:
+        """
+        Accepts the tapped card, or warns if it is already registered.
+
+        @param result: The card and its member, or None if it is not registered.
+        """
+        self._set_busy(False)
+        rfid_tag, existing_member = result
+        if existing_member:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Card Already Registered",
+                f"This card is already registered to position: {existing_member['position']}",
+            )
+            return
+        self._accept_card(rfid_tag)
+
+    def _accept_card(self, rfid_tag: str) -> None:
+        """
+        Stores the card to be registered and shows it in the status label.
+
+        @param rfid_tag: The RFID card identifier.
+        """
+        self.current_rfid = rfid_tag
+        self._set_status(f"Card detected: {rfid_tag}", "ok")
 
     def register_card(self) -> None:
         """
         Registers the detected RFID card with the selected position.
-        Queries the asg_members table for a member with the matching position
-        and updates its RFID card value.
+        Looks up the position's member in the map loaded when the window opened
+        and updates its RFID card value. The update runs on the thread pool
+        and reports back to _on_member_updated.
 
         @raise: Displays a warning or error message if validation fails or update is unsuccessful.
         """
-        try:
-            # Ensure an RFID card has been detected.
-            if not self.current_rfid:
-                QtWidgets.QMessageBox.warning(
-                    self, "Validation Error", "Please tap an RFID card"
-                )
-                return
+        # Ensure an RFID card has been detected.
+        if not self.current_rfid:
+            QtWidgets.QMessageBox.warning(
+                self, "Validation Error", "Please tap an RFID card"
+            )
+            return
 
-            # Retrieve the selected position from the combo box.
-            selected_position = self.position_combo.currentData()
-            if not selected_position:
-                QtWidgets.QMessageBox.warning(
-                    self, "Validation Error", "Please select a valid position."
-                )
-                return
-
-            # Query the asg_members table for a member record matching the selected position.
-            response = (
-                self.db_manager.supabase.table("asg_members")
-                .select("*")
-                .eq("position", selected_position)
-                .execute()
+        # Retrieve the selected position from the combo box.
+        selected_position = self.position_combo.currentText()
+        if not selected_position:
+            QtWidgets.QMessageBox.warning(
+                self, "Validation Error", "Please select a valid position."
             )
-            # Check if a member record exists for the selected position.
-            if response.data and len(response.data) > 0:
-                member_record: Dict[str, Any] = response.data[0]
-                # Warn if an RFID card is already set for this member.
-                if member_record.get("rfid_tag"):
-                    if not self.override_checkbox.isChecked():
-                        reply = QtWidgets.QMessageBox.question(
-                            self,
-                            "Overwrite Confirmation",
-                            "This position already has an RFID card registered. Do you want to overwrite it?",
-                            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-                        )
-                        if reply == QtWidgets.QMessageBox.No:
-                            return
-                    else:
-                        print(
-                            f"Override enabled: overriding existing RFID registration for position {selected_position}."
-                        )
-                # Update the member record with the new RFID card.
-                success = self.db_manager.update_member(
-                    member_record["id"], {"rfid_tag": self.current_rfid}
+            return
+
+        member_record = self._members_by_position.get(selected_position)
+
+        # Check if a member record exists for the selected position.
+        if member_record is None:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "No Member Found",
+                "No member record found for the selected position.",
+            )
+            return
+
+        # Warn if an RFID card is already set for this member.
+        if member_record.get("rfid_tag"):
+            if not self.override_checkbox.isChecked():
+                reply = QtWidgets.QMessageBox.question(
+                    self,
+                    "Overwrite Confirmation",
+                    "This position already has an RFID card registered. Do you want to overwrite it?",
+                    QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
                 )
-                if success:
-                    QtWidgets.QMessageBox.information(
-                        self,
-                        "Success",
-                        f"Successfully updated RFID card for position: {selected_position}",
-                    )
-                    # Stop RFID scanning and disconnect the card detection signal.
-                    self.rfid_reader.stop_reading()
-                    try:
-                        self.card_detected.disconnect(self.handle_card_tap)
-                    except Exception as disconn_error:
-                        print(f"Error disconnecting signal: {disconn_error}")
-                    self.accept()
-                else:
-                    QtWidgets.QMessageBox.critical(
-                        self, "Error", "Failed to update RFID card"
-                    )
+                if reply == QtWidgets.QMessageBox.No:
+                    return
             else:
-                QtWidgets.QMessageBox.warning(
-                    self,
-                    "No Member Found",
-                    "No member record found for the selected position.",
+                log.debug(
+                    "Override enabled: overriding existing RFID registration "
+                    "for position %s.",
+                    selected_position,
                 )
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self, "Error", f"Error updating card: {str(e)}"
-            )
 
-    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        # Update the member record with the new RFID card.
+        self._start_task(
+            self._update_member_rfid,
+            self._on_member_updated,
+            selected_position,
+            member_record["id"],
+            self.current_rfid,
+        )
+
+    def _start_task(
+        self, fn: Callable[..., Any], on_finished: Callable[[Any], None], *args: Any
+    ) -> None:
         """
-        Handle the window show event.
-        Restart the RFID reader when the window is displayed.
+        Runs a blocking database call on the thread pool with the register
+        button disabled and a busy cursor shown until it reports back.
 
-        @param event: The show event.
+        @param fn: The blocking callable to run
+        @param on_finished: Slot receiving the callable's result on the GUI thread
+        @param args: Arguments for the callable
         """
-        super().showEvent(event)
-        try:
-            self.rfid_reader.reinitialize()  # Reinitialize the RFID reader.
-            self.reader_thread = Thread(
-                target=self.rfid_reader.start_reading,
-                args=(self._on_card_detected,),
-                daemon=True,
+        self._set_busy(True)
+        worker = Worker(fn, *args)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(self._on_register_error)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _set_busy(self, busy: bool) -> None:
+        """
+        Toggles the busy state while a database call is in flight.
+
+        @param busy: True while waiting on the database.
+        """
+        self.register_btn.setEnabled(not busy)
+        if busy:
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+        else:
+            QtWidgets.QApplication.restoreOverrideCursor()
+
+    def _update_member_rfid(
+        self, selected_position: str, member_id: int, rfid_tag: str
+    ) -> Tuple[str, str, bool]:
+        """
+        Stores the RFID card on a member record. Runs off the GUI thread.
+
+        @param selected_position: The position being registered.
+        @param member_id: The member's ID.
+        @param rfid_tag: The RFID card identifier.
+        @return: The position, the card and whether the update succeeded.
+        """
+        success = self.db_manager.update_member(member_id, {"rfid_tag": rfid_tag})
+        return selected_position, rfid_tag, success
+
+    def _on_member_updated(self, result: Tuple[str, str, bool]) -> None:
+        """
+        Reports the result of the RFID update and closes on success.
+
+        @param result: The position, the card and whether the update succeeded.
+        """
+        self._set_busy(False)
+        selected_position, rfid_tag, success = result
+        if success:
+            # Keep the cached map in step with the database
+            self._members_by_position[selected_position]["rfid_tag"] = rfid_tag
+            QtWidgets.QMessageBox.information(
+                self,
+                "Success",
+                f"Successfully updated RFID card for position: {selected_position}",
             )
-            self.reader_thread.start()
-        except Exception as e:
-            self._show_error_and_close(f"Failed to start RFID reader: {str(e)}")
+            # Stop handling card reads before closing.
+            self._release_reader()
+            self.accept()
+        else:
+            QtWidgets.QMessageBox.critical(self, "Error", "Failed to update RFID card")
+
+    def _on_register_error(self, error: str) -> None:
+        """
+        Reports an error raised by a background registration call.
+
+        @param error: The error message.
+        """
+        self._set_busy(False)
+        QtWidgets.QMessageBox.critical(self, "Error", f"Error updating card: {error}")
+
+    def _tear_down(self) -> None:
+        """
+        Releases the RFID reader and hands focus back to the parent window.
+        Runs once, from whichever of hide or close happens first (accept/reject
+        hide the dialog without a close event).
+        """
+        if self._torn_down:
+            return
+        self._torn_down = True
+
+        self._release_reader()
+
+        # Ensure parent window stays in full screen and focused
+        if self.parent():
+            self.parent().showFullScreen()
+            self.parent().raise_()
+            self.parent().activateWindow()
 
     def hideEvent(self, event: QtGui.QHideEvent) -> None:
         """
         Handle the window hide event.
-        Stops the RFID reader when the window is hidden.
 
         @param event: The hide event.
         """
         super().hideEvent(event)
         try:
-            if hasattr(self, "rfid_reader"):
-                self.rfid_reader.stop_reading()
-            if hasattr(self, "reader_thread"):
-                self.reader_thread.join(timeout=1.0)
-
-            # Ensure parent window stays in full screen and focused
-            if self.parent():
-                self.parent().showFullScreen()
-                self.parent().raise_()
-                self.parent().activateWindow()
+            self._tear_down()
         except Exception as e:
-            print(f"Error stopping RFID reader: {str(e)}")
+            log.warning("Error during cleanup: %s", e)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """
         Handle the window close event.
-        Stops the RFID reader and cleans up resources before closing.
 
         @param event: The close event.
         """
         try:
-            if hasattr(self, "rfid_reader"):
-                self.rfid_reader.stop_reading()
-            if hasattr(self, "reader_thread"):
-                self.reader_thread.join(timeout=1.0)
-
-            # Ensure parent window stays in full screen and focused
-            if self.parent():
-                self.parent().showFullScreen()
-                self.parent().raise_()
-                self.parent().activateWindow()
-
-            event.accept()
+            self._tear_down()
         except Exception as e:
-            print(f"Error during cleanup: {str(e)}")
-            event.accept()  # Still accept the event to ensure application closes
+            log.warning("Error during cleanup: %s", e)
+        event.accept()  # Always accept the event to ensure the window closes
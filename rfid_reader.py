@@ -4,11 +4,18 @@ RFID reader module for the attendance system.
 Handles all MFRC522 RFID reader operations.
 """
 
+import logging
+import threading
 import time
 from typing import Optional, Tuple, Callable
 from mfrc522 import SimpleMFRC522
 import RPi.GPIO as GPIO
 
+import config
+
+# Handlers are configured once in main.py
+log = logging.getLogger("asg.rfid")
+
 
 class RFIDReader:
     """
@@ -20,6 +27,11 @@ class RFIDReader:
         Initialize the RFID reader.
         Sets up GPIO and creates SimpleMFRC522 instance.
         """
+        # Set to wake the read loop before its poll interval is up
+        self._wake = threading.Event()
+        # Cleared by pause_reading; the read loop blocks on it while paused
+        self._active = threading.Event()
+        self._active.set()
         self._setup_gpio()
         self._continue_reading = True
 
@@ -46,14 +58,30 @@ class RFIDReader:
                         The function should accept a card_id parameter.
         """
         self._continue_reading = True
+        # Last card seen and when; reads of the same card are suppressed
+        # until it has been off the reader for RFID_DEBOUNCE_SECONDS
+        last_card_id: Optional[int] = None
+        last_seen = 0.0
         try:
             while self._continue_reading:
+                if not self._active.is_set():
+                    self._active.wait()  # Idle without touching SPI until resumed
+                    continue
                 card_id = self.read_card()
                 if card_id:
-                    callback(str(card_id))
-                time.sleep(0.5)  # Prevent excessive CPU usage
+                    now = time.monotonic()
+                    if (
+                        card_id != last_card_id
+                        or now - last_seen >= config.RFID_DEBOUNCE_SECONDS
+                    ):
+                        callback(str(card_id))
+                    last_card_id = card_id
+                    last_seen = now
+                # Sleep until the next poll unless woken early (e.g. by stop_reading)
+                self._wake.wait(config.RFID_POLL_INTERVAL_SECONDS)
+                self._wake.clear()
         except Exception as e:
-            print(f"Error reading RFID: {e}")
+            log.warning("Error reading RFID: %s", e)
         finally:
             self.cleanup()
 
@@ -62,6 +90,21 @@ class RFIDReader:
         Stop the continuous reading loop.
         """
         self._continue_reading = False
+        self._wake.set()  # Wake the loop so it exits immediately
+        self._active.set()
+
+    def pause_reading(self) -> None:
+        """
+        Pause the reading loop without ending it or releasing GPIO.
+        """
+        self._active.clear()
+        self._wake.set()
+
+    def resume_reading(self) -> None:
+        """
+        Resume a reading loop paused by pause_reading.
+        """
+        self._active.set()
 
     def read_card(self) -> Optional[int]:
         """
@@ -70,10 +113,13 @@ class RFIDReader:
         @return: Card ID if successful, None otherwise
         """
         try:
-            card_id, _ = self.reader.read_no_block()
+            # Only the UID is used; skip the auth and block read that
+            # read_no_block performs, so each poll holds the GIL for fewer
+            # SPI transfers.
+            card_id = self.reader.read_id_no_block()
             return card_id if card_id else None
         except Exception as e:
-            print(f"Error reading card: {e}")
+            log.warning("Error reading card: %s", e)
             self._setup_gpio()  # Try to reinitialize on error
             return None
 
@@ -84,7 +130,7 @@ class RFIDReader:
         try:
             GPIO.cleanup()
         except Exception as e:
-            print(f"Error during GPIO cleanup: {e}")
+            log.warning("Error during GPIO cleanup: %s", e)
 
     def reinitialize(self) -> None:
         """
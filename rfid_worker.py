@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+RFID worker thread module for the attendance system.
+Runs the RFID read loop on a long-lived QThread shared by all windows.
+"""
+
+from typing import Optional
+from PyQt5 import QtCore
+
+from rfid_reader import RFIDReader
+
+
+class RFIDWorker(QtCore.QThread):
+    """
+    Runs RFIDReader.start_reading on a dedicated QThread.
+    Windows subscribe to card_detected instead of starting their own threads;
+    the signal is delivered to slots on the GUI thread via a queued connection.
+    """
+
+    # Emitted with the card ID every time a card is read
+    card_detected = QtCore.pyqtSignal(str)
+
+    def __init__(
+        self, rfid_reader: RFIDReader, parent: Optional[QtCore.QObject] = None
+    ) -> None:
+        """
+        Initialize the worker thread.
+
+        @param rfid_reader: The RFID reader to poll
+        @param parent: Optional parent object owning the thread
+        """
+        super().__init__(parent)
+        self.rfid_reader = rfid_reader
+
+    def run(self) -> None:
+        """
+        Thread entry point. Blocks in the reader loop until stop() is called.
+        """
+        self.rfid_reader.start_reading(self.card_detected.emit)
+
+    def pause(self) -> None:
+        """
+        Stops delivering card reads while keeping the thread and GPIO alive.
+        """
+        self.rfid_reader.pause_reading()
+
+    def resume(self) -> None:
+        """
+        Resumes delivering card reads after pause().
+        """
+        self.rfid_reader.resume_reading()
+
+    def stop(self, timeout_ms: int = 1000) -> None:
+        """
+        Stops the reader loop and waits for the thread to finish.
+
+        @param timeout_ms: Maximum time to wait for the thread in milliseconds
+        """
+        self.rfid_reader.stop_reading()
+        if self.isRunning():
+            self.wait(timeout_ms)
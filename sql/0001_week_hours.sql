@@ -0,0 +1,14 @@
+-- Sum of completed session hours for a member since a given instant.
+-- Used by the Check Hours window so a tap transfers one scalar instead of
+-- every asg_logs row for the week.
+create or replace function public.week_hours(uid bigint, since timestamptz)
+returns double precision
+language sql
+stable
+as $$
+    select coalesce(sum(duration), 0)::double precision
+    from public.asg_logs
+    where user_id = uid
+      and sign_in_time >= since
+      and duration is not null;
+$$;
@@ -0,0 +1,59 @@
+-- Sign a member in by RFID tag in a single round-trip: looks up the member,
+-- marks them in the office and inserts the sign-in log in one transaction.
+-- Returns the inserted asg_logs row, or no rows for an unknown tag.
+create or replace function public.sign_in_rfid(tag text)
+returns setof public.asg_logs
+language sql
+as $$
+    with m as (
+        select id, name
+        from public.asg_members
+        where rfid_tag = tag
+        limit 1
+    ), upd as (
+        update public.asg_members
+        set inoffice = true
+        from m
+        where public.asg_members.id = m.id
+    )
+    insert into public.asg_logs (user_id, sign_in_time, message)
+    select m.id, now(), split_part(m.name, ' ', 1) || ' Signed In'
+    from m
+    returning *;
+$$;
+
+-- Sign a member out by RFID tag in a single round-trip: closes the member's
+-- open session, computes its duration in hours and marks them out of the
+-- office. Returns the updated asg_logs row, or no rows when there is no
+-- member or no open session for the tag.
+create or replace function public.sign_out_rfid(tag text)
+returns setof public.asg_logs
+language sql
+as $$
+    with m as (
+        select id, name
+        from public.asg_members
+        where rfid_tag = tag
+        limit 1
+    ), s as (
+        select l.id
+        from public.asg_logs l
+        join m on l.user_id = m.id
+        where l.sign_out_time is null
+        order by l.sign_in_time desc
+        limit 1
+    ), upd as (
+        update public.asg_members
+        set inoffice = false
+        from m
+        where public.asg_members.id = m.id
+          and exists (select 1 from s)
+    )
+    update public.asg_logs
+    set sign_out_time = now(),
+        duration = extract(epoch from (now() - public.asg_logs.sign_in_time)) / 3600.0,
+        message = split_part(m.name, ' ', 1) || ' Signed Out'
+    from s, m
+    where public.asg_logs.id = s.id
+    returning public.asg_logs.*;
+$$;
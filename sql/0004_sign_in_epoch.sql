@@ -0,0 +1,10 @@
+-- Computed column exposing asg_logs.sign_in_time as epoch seconds so clients
+-- can build a datetime without parsing ISO 8601 strings.
+-- Select it explicitly, e.g. select("id, sign_in_time, sign_in_epoch").
+create or replace function public.sign_in_epoch(public.asg_logs)
+returns double precision
+language sql
+immutable
+as $$
+    select extract(epoch from $1.sign_in_time)::double precision;
+$$;
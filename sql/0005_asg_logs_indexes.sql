@@ -0,0 +1,4 @@
+-- Serves week_hours (user_id = ? and sign_in_time >= ?). Open-session lookups
+-- use the unique partial index from 0007.
+create index if not exists asg_logs_user_signin_idx
+    on public.asg_logs (user_id, sign_in_time desc);
@@ -0,0 +1,19 @@
+-- The first (lowest id) non-vacant member of each position, in order of first
+-- appearance, for the registration position picker and its position -> member
+-- map. Deduplication happens here so only one row per position crosses the
+-- network.
+create or replace function public.list_positions()
+returns table (id bigint, position text, rfid_tag text)
+language sql
+stable
+as $$
+    select first_members.id, first_members.position, first_members.rfid_tag
+    from (
+        select distinct on (m.position) m.id, m.position, m.rfid_tag
+        from public.asg_members m
+        where coalesce(trim(m.name), '') <> ''
+          and m.position is not null
+        order by m.position, m.id
+    ) first_members
+    order by first_members.id;
+$$;
@@ -0,0 +1,33 @@
+-- Allow at most one open session per member. Two taps racing through
+-- sign_in_rfid could otherwise both insert a sign-in log; the unique partial
+-- index makes the second insert conflict instead. Open sessions are a tiny
+-- subset of asg_logs, so the same index also serves the active-session lookup
+-- (user_id = ? and sign_out_time is null) and the sign-out/auto sign-out RPCs.
+-- Close any duplicate open sessions before running this script.
+create unique index if not exists asg_logs_one_open_session_idx
+    on public.asg_logs (user_id)
+    where sign_out_time is null;
+
+-- Same as 0002, but skips the insert when the member already has an open
+-- session. Returns no rows in that case, as for an unknown tag.
+create or replace function public.sign_in_rfid(tag text)
+returns setof public.asg_logs
+language sql
+as $$
+    with m as (
+        select id, name
+        from public.asg_members
+        where rfid_tag = tag
+        limit 1
+    ), upd as (
+        update public.asg_members
+        set inoffice = true
+        from m
+        where public.asg_members.id = m.id
+    )
+    insert into public.asg_logs (user_id, sign_in_time, message)
+    select m.id, now(), split_part(m.name, ' ', 1) || ' Signed In'
+    from m
+    on conflict (user_id) where sign_out_time is null do nothing
+    returning *;
+$$;
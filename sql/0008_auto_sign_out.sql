@@ -0,0 +1,25 @@
+-- Scheduled auto sign-out in one round-trip and one transaction: closes every
+-- open session (crediting 0 hours under an hour, 1 hour otherwise) and marks
+-- those members as out. Returns only the members whose session was closed.
+create or replace function public.auto_sign_out()
+returns table(name text, "position" text)
+language sql
+as $$
+    with closed as (
+        update public.asg_logs l
+        set sign_out_time = now(),
+            duration = case
+                when now() - l.sign_in_time < interval '1 hour' then 0
+                else 1
+            end,
+            message = split_part(m.name, ' ', 1) || ' Automatically signed out.'
+        from public.asg_members m
+        where m.id = l.user_id
+          and l.sign_out_time is null
+        returning l.user_id
+    )
+    update public.asg_members
+    set inoffice = false
+    where id in (select user_id from closed)
+    returning asg_members.name, asg_members.position;
+$$;
@@ -0,0 +1,36 @@
+-- Same as sign_out_rfid in 0002, but returns only the session duration in
+-- hours (or null when there is no member or no open session for the tag)
+-- instead of the whole asg_logs row.
+drop function if exists public.sign_out_rfid(text);
+
+create function public.sign_out_rfid(tag text)
+returns double precision
+language sql
+as $$
+    with m as (
+        select id, name
+        from public.asg_members
+        where rfid_tag = tag
+        limit 1
+    ), s as (
+        select l.id
+        from public.asg_logs l
+        join m on l.user_id = m.id
+        where l.sign_out_time is null
+        order by l.sign_in_time desc
+        limit 1
+    ), upd as (
+        update public.asg_members
+        set inoffice = false
+        from m
+        where public.asg_members.id = m.id
+          and exists (select 1 from s)
+    )
+    update public.asg_logs
+    set sign_out_time = now(),
+        duration = extract(epoch from (now() - public.asg_logs.sign_in_time)) / 3600.0,
+        message = split_part(m.name, ' ', 1) || ' Signed Out'
+    from s, m
+    where public.asg_logs.id = s.id
+    returning public.asg_logs.duration;
+$$;
@@ -0,0 +1,48 @@
+-- Sign in / sign out by member id for callers that have already resolved the
+-- RFID tag (the main window looks members up from its cache). Same behaviour
+-- as sign_in_rfid (0007) and sign_out_rfid (0009), but the member row is read
+-- by primary key inside the inoffice update instead of a separate lookup by
+-- rfid_tag.
+create or replace function public.sign_in_member(uid bigint)
+returns setof public.asg_logs
+language sql
+as $$
+    with m as (
+        update public.asg_members
+        set inoffice = true
+        where id = uid
+        returning id, name
+    )
+    insert into public.asg_logs (user_id, sign_in_time, message)
+    select m.id, now(), split_part(m.name, ' ', 1) || ' Signed In'
+    from m
+    on conflict (user_id) where sign_out_time is null do nothing
+    returning *;
+$$;
+
+create or replace function public.sign_out_member(uid bigint)
+returns double precision
+language sql
+as $$
+    with s as (
+        select l.id
+        from public.asg_logs l
+        where l.user_id = uid
+          and l.sign_out_time is null
+        order by l.sign_in_time desc
+        limit 1
+    ), m as (
+        update public.asg_members
+        set inoffice = false
+        where id = uid
+          and exists (select 1 from s)
+        returning name
+    )
+    update public.asg_logs
+    set sign_out_time = now(),
+        duration = extract(epoch from (now() - public.asg_logs.sign_in_time)) / 3600.0,
+        message = split_part(m.name, ' ', 1) || ' Signed Out'
+    from s, m
+    where public.asg_logs.id = s.id
+    returning public.asg_logs.duration;
+$$;
@@ -8,7 +8,7 @@ Make sure SUPABASE_URL and SUPABASE_KEY environment variables are configured pro
 """
 
 import json
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, get_db_manager
 
 
 def main() -> None:
@@ -16,8 +16,8 @@ def main() -> None:
     The main function that retrieves and prints real data from the database.
     """
     try:
-        # Instantiate DatabaseManager, which loads the environment variables and initializes Supabase client
-        db_manager: DatabaseManager = DatabaseManager()
+        # Get the shared DatabaseManager, which loads the environment variables and initializes Supabase client
+        db_manager: DatabaseManager = get_db_manager()
 
         # Retrieve all positions from the database
         positions: list[dict[str, object]] = db_manager.get_positions()
@@ -5,18 +5,174 @@ Implements the main window and UI components using PyQt5.
 Optimized for Raspberry Pi 2 Model B.
 """
 
-from datetime import datetime
-from threading import Thread
+from collections import deque
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+import os
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Callable, Deque, Dict, Any, NamedTuple, Tuple
 from PyQt5 import QtWidgets, QtCore, QtGui
 
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, get_db_manager
 from rfid_reader import RFIDReader
-from registration_window import RegistrationWindow
+from rfid_worker import RFIDWorker
+from workers import Worker
 import config
 from discord_webhook import DiscordWebhook
 
+# Main window stylesheet, parsed once when the application starts. Widgets are
+# matched by object name; the "#x, #x QWidget" pairs style a container and its
+# children the way a bare "QWidget { ... }" sheet on the container did.
+_APP_QSS = """
+#mainWindow, #mainWindow * {
+    background-color: black;
+    color: white;
+}
+#statusCircle {
+    background-color: rgba(128, 128, 128, 0.5);
+    border-radius: 75px;
+    border: 2px solid rgba(255, 255, 255, 0.2);
+}
+#statusCircle[status="green"] {
+    background-color: rgba(0, 255, 0, 0.5);
+}
+#statusCircle[status="red"] {
+    background-color: rgba(255, 0, 0, 0.5);
+}
+#header, #header QWidget {
+    background: qlineargradient(
+        x1: 0, y1: 0, x2: 0, y2: 1,
+        stop: 0 rgba(0, 0, 0, 0.8),
+        stop: 1 rgba(0, 0, 0, 0.3)
+    );
+    border-radius: 15px;
+    padding: 10px;
+}
+#header #logo {
+    padding-right: 10px;
+}
+#header #subtitle {
+    margin-top: -5px;
+}
+#message, #message QWidget {
+    background: rgba(255, 255, 255, 0.05);
+    border-radius: 15px;
+    margin: 5px 0;
+}
+#content, #content QWidget {
+    background: rgba(255, 255, 255, 0.05);
+    border-radius: 15px;
+    padding: 15px;
+}
+#content #log {
+    background-color: rgba(0, 0, 0, 0.3);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: 15px;
+    padding: 15px;
+    color: white;
+}
+#footer, #footer QWidget {
+    background: rgba(0, 0, 0, 0.3);
+    border-top: 1px solid rgba(255, 255, 255, 0.1);
+    margin: 5px 0px 2px 0px;
+}
+#footer QPushButton {
+    background-color: rgba(255, 255, 255, 0.1);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: 5px;
+    padding: 2px 10px;
+    color: white;
+    font-weight: bold;
+}
+#footer QPushButton:hover {
+    background-color: rgba(255, 255, 255, 0.2);
+}
+#footer #uploadLogs {
+    margin-left: 10px;
+}
+#footer #credit {
+    color: rgba(255, 255, 255, 0.8);
+}
+"""
+
+
+class _MainFonts(NamedTuple):
+    """Screen-size dependent fonts for the main window."""
+
+    title: QtGui.QFont
+    subtitle: QtGui.QFont
+    info: QtGui.QFont
+    log: QtGui.QFont
+    button: QtGui.QFont
+    footer: QtGui.QFont
+
+
+@lru_cache(maxsize=1)
+def _main_fonts(height: int) -> _MainFonts:
+    """
+    Builds the main window's fonts for a screen height. Cached, so each font
+    is resolved once and shared by every widget that uses it.
+
+    @param height: Screen height in pixels
+    @return: The fonts for that screen height
+    """
+    log_font = QtGui.QFont("Monospace", int(height * 0.025))  # 2.5% (~15 pts)
+    log_font.setStyleHint(QtGui.QFont.TypeWriter)
+    footer_font = QtGui.QFont("Arial", 11)  # Even smaller font size
+    footer_font.setItalic(True)
+    return _MainFonts(
+        # 4% of screen height (~24 pts for 600px)
+        title=QtGui.QFont("Arial", int(height * 0.04), QtGui.QFont.Bold),
+        # 3% of screen height (increased from 2.5%)
+        subtitle=QtGui.QFont("Arial", int(height * 0.03)),
+        # 3% of screen height (~18 pts)
+        info=QtGui.QFont("Arial", int(height * 0.03), QtGui.QFont.Bold),
+        log=log_font,
+        button=QtGui.QFont("Arial", 11),
+        footer=footer_font,
+    )
+
+
+# Info label style while it shows the clock
+_DATETIME_QSS = "color: #CCCCCC; font-size: 16pt;"
+
+# Weekday operating window; the system sleeps outside [_START_T, _SLEEP_T)
+_START_T = time(config.START_TIME_HOUR, config.START_TIME_MINUTE)
+_SLEEP_T = time(config.SLEEP_TIME_HOUR, config.SLEEP_TIME_MINUTE)
+
+# Wall-clock (hour, minute) points where check_system_state can change state
+_STATE_BOUNDARIES = (
+    (config.START_TIME_HOUR, config.START_TIME_MINUTE),
+    (config.SLEEP_TIME_HOUR, config.SLEEP_TIME_MINUTE),
+    (config.AUTO_SIGNOUT_HOUR, 0),
+)
+# Longest gap between state checks, so clock adjustments are picked up
+_STATE_CHECK_MAX_INTERVAL = timedelta(hours=1)
+# Fire just after a boundary so the check sees the new minute
+_STATE_CHECK_MARGIN = timedelta(seconds=1)
+
+# Lines kept in the log view; older ones are trimmed
+_LOG_MAX_LINES = 100
+# Milliseconds to collect log lines before writing them in one batch
+_LOG_FLUSH_DELAY_MS = 50
+# Timestamp format for log lines
+_LOG_TS_FMT = "%Y-%m-%d %H:%M:%S"
+# Log line template: timestamp, message
+_LOG_LINE = "[{}] {}"
+
+
+def _char_format(color: Optional[str] = None) -> QtGui.QTextCharFormat:
+    """
+    Builds a text format for log lines.
+
+    @param color: Text color, or None to use the widget's default color
+    @return: The character format
+    """
+    fmt = QtGui.QTextCharFormat()
+    if color is not None:
+        fmt.setForeground(QtGui.QColor(color))
+    return fmt
+
 
 class AttendanceApp(QtWidgets.QMainWindow):
     """
@@ -24,8 +180,21 @@ class AttendanceApp(QtWidgets.QMainWindow):
     Optimized for Raspberry Pi 2 Model B with resource management and error handling.
     """
 
-    # Define a custom signal for RFID card detection
-    card_detected = QtCore.pyqtSignal(str)
+    # Log kinds carried by log_message
+    _LOG_PLAIN, _LOG_SIGN_IN, _LOG_SIGN_OUT = range(3)
+
+    # Text format for each log kind, shared by every flush
+    _FMT_PLAIN = _char_format()
+    _FMT_SIGN_IN = _char_format("#00FF00")
+    _FMT_SIGN_OUT = _char_format("#FF0000")
+    _LOG_FORMATS = {
+        _LOG_PLAIN: _FMT_PLAIN,
+        _LOG_SIGN_IN: _FMT_SIGN_IN,
+        _LOG_SIGN_OUT: _FMT_SIGN_OUT,
+    }
+
+    # Timestamped log line and kind, handled by _append_log_slot on the GUI thread
+    log_message = QtCore.pyqtSignal(str, int)
 
     def __init__(self) -> None:
         """
@@ -34,9 +203,25 @@ class AttendanceApp(QtWidgets.QMainWindow):
         """
         super().__init__()
 
-        # Set window to full screen
-        self.showFullScreen()
-        self.setStyleSheet("background-color: black; color: white;")
+        # Direct from the GUI thread, queued from worker threads
+        self.log_message.connect(self._append_log_slot)
+        # Timestamped log lines waiting for the next flush; bounded because
+        # lines beyond what the view keeps would be trimmed anyway
+        self._log_buffer: Deque[Tuple[str, int]] = deque(maxlen=_LOG_MAX_LINES)
+        # Lines the view holds, uploaded without reading the text document back
+        self._log_lines: Deque[Tuple[str, int]] = deque(maxlen=_LOG_MAX_LINES)
+        # Lines taken by the running log upload and whether it was automatic;
+        # None when no upload is running
+        self._log_upload: Optional[Tuple[Tuple[Tuple[str, int], ...], bool]] = None
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        # (epoch second, formatted timestamp) of the last log line; replaced
+        # as one tuple so append_log stays safe to call from any thread
+        self._log_ts_cache: Tuple[int, str] = (-1, "")
+
+        self.setObjectName("mainWindow")
+        QtWidgets.QApplication.instance().setStyleSheet(_APP_QSS)
         # Hide the mouse cursor
         self.setCursor(QtCore.Qt.BlankCursor)
 
@@ -45,41 +230,64 @@ class AttendanceApp(QtWidgets.QMainWindow):
         self.central_widget = None
         self.is_processing_tap = False
         self.is_showing_message = False  # Track if we're showing a message
+        self._last_dt_str = ""  # Clock text currently in the info label
         self.last_auto_signout_date = None  # Track the date of last auto sign-out
-        self.auto_signout_attempted = (
-            False  # Track if auto sign-out was attempted this hour
-        )
 
         # Initialize Discord webhook
         self.discord_webhook = DiscordWebhook(config.DISCORD_WEBHOOK_URL)
 
-        self.setup_ui()
+        # Set below; left as None if initialization fails part way
+        self.db_manager: Optional[DatabaseManager] = None
+        self.rfid_reader: Optional[RFIDReader] = None
+        self.rfid_worker: Optional[RFIDWorker] = None
+
+        # Build the widget tree without repainting, then lay it out once and
+        # show it full screen
+        self.setUpdatesEnabled(False)
+        try:
+            self.setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.showFullScreen()
 
         try:
             # Initialize components with error handling
-            self.db_manager = DatabaseManager()
+            self.db_manager = get_db_manager()
+            # Keep the member table in memory so most taps skip the lookup
+            self.db_manager.preload_members()
             self.rfid_reader = RFIDReader()
+            # Long-lived reader thread shared with the dialogs
+            self.rfid_worker = RFIDWorker(self.rfid_reader, self)
         except Exception as e:
             self._show_error_and_exit(f"Failed to initialize components: {str(e)}")
             return
 
-        # Timer for checking auto sign out and sleep/wake state
+        # Timer for checking auto sign out and sleep/wake state; armed by
+        # check_system_state for the next sleep, wake or auto sign-out time
         self.state_timer = QtCore.QTimer(self)
+        self.state_timer.setSingleShot(True)
+        self.state_timer.setTimerType(QtCore.Qt.PreciseTimer)
         self.state_timer.timeout.connect(self.check_system_state)
-        self.state_timer.start(30000)  # Check every 30 seconds for more accuracy
 
-        # Timer for updating date/time display
+        # Timer for updating date/time display; update_datetime re-arms it for
+        # the next wall-clock second so ticks land on the second boundary
         self.datetime_timer = QtCore.QTimer(self)
+        self.datetime_timer.setSingleShot(True)
+        self.datetime_timer.setTimerType(QtCore.Qt.CoarseTimer)
         self.datetime_timer.timeout.connect(self.update_datetime)
-        self.datetime_timer.start(1000)  # Update every second
 
         # Timer for clearing welcome message
         self.message_timer = QtCore.QTimer(self)
         self.message_timer.timeout.connect(self.clear_welcome_message)
         self.message_timer.setSingleShot(True)
 
-        # Connect the card detected signal to the handler
-        self.card_detected.connect(self.handle_tap)
+        # Timer for resetting the status circle after a tap; each tap restarts it
+        self._reset_timer = QtCore.QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.timeout.connect(self.reset_circle_color)
+
+        # Handle card reads delivered from the RFID worker thread
+        self.rfid_worker.card_detected.connect(self.handle_tap)
 
         try:
             # Start RFID reader in a separate thread with error handling
@@ -98,37 +306,22 @@ class AttendanceApp(QtWidgets.QMainWindow):
         screen = QtWidgets.QApplication.primaryScreen()
         screen_size = screen.size()
 
-        # Calculate base font sizes based on screen height
-        title_size = int(
-            screen_size.height() * 0.04
-        )  # 4% of screen height (~24 pts for 600px)
-        subtitle_size = int(
-            screen_size.height() * 0.03
-        )  # 3% of screen height (increased from 2.5%)
-        datetime_size = int(
-            screen_size.height() * 0.022
-        )  # 2.2% of screen height (increased from 1.8%)
-        info_size = int(screen_size.height() * 0.03)  # 3% of screen height (~18 pts)
-        log_size = int(screen_size.height() * 0.025)  # 2.5% of screen height (~15 pts)
-        footer_size = int(screen_size.height() * 0.02)  # 2% of screen height (~12 pts)
+        # Fonts derived from the screen height (built once)
+        fonts = _main_fonts(screen_size.height())
 
         # Create central widget and layout
         self.central_widget = QtWidgets.QWidget(self)
+        # Its solid black background covers the whole window, so Qt can skip
+        # painting the main window underneath it
+        self.central_widget.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, True)
+        self.central_widget.setAttribute(QtCore.Qt.WA_NoSystemBackground, True)
         self.setCentralWidget(self.central_widget)
         main_layout = QtWidgets.QVBoxLayout(self.central_widget)
 
         # Create status circle
         self.status_circle = QtWidgets.QWidget(self)
+        self.status_circle.setObjectName("statusCircle")
         self.status_circle.setFixedSize(150, 150)  # Increased circle size
-        self.status_circle.setStyleSheet(
-            """
-            QWidget {
-                background-color: rgba(128, 128, 128, 0.5);
-                border-radius: 75px;
-                border: 2px solid rgba(255, 255, 255, 0.2);
-            }
-            """
-        )
 
         # Create breathing animation
         self.breath_animation = QtCore.QPropertyAnimation(self.status_circle, b"size")
@@ -161,19 +354,7 @@ class AttendanceApp(QtWidgets.QMainWindow):
 
         # Header container with gradient background
         header_container = QtWidgets.QWidget()
-        header_container.setStyleSheet(
-            """
-            QWidget {
-                background: qlineargradient(
-                    x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 rgba(0, 0, 0, 0.8),
-                    stop: 1 rgba(0, 0, 0, 0.3)
-                );
-                border-radius: 15px;
-                padding: 10px;
-            }
-            """
-        )
+        header_container.setObjectName("header")
         header_layout = QtWidgets.QVBoxLayout(header_container)
         header_layout.setSpacing(2)  # Reduced spacing between header elements from 5
 
@@ -185,19 +366,28 @@ class AttendanceApp(QtWidgets.QMainWindow):
 
         # Add ASG logo
         logo_label = QtWidgets.QLabel(self)
+        logo_label.setObjectName("logo")
         logo_size = int(
             screen_size.height() * 0.18
         )  # 18% of screen height (increased from 15%)
-        logo_pixmap = QtGui.QPixmap("assets/ASG.png")
-        scaled_pixmap = logo_pixmap.scaled(
-            logo_size,
-            logo_size,
-            QtCore.Qt.KeepAspectRatio,
-            QtCore.Qt.SmoothTransformation,
-        )
+        # Keyed like the registration window's logo so the two can share it
+        cache_key = f"asg_logo_{logo_size}"
+        scaled_pixmap = QtGui.QPixmapCache.find(cache_key)
+        if scaled_pixmap is None:
+            prescaled_path = config.LOGO_PRESCALED_PATH.format(logo_size)
+            if os.path.exists(prescaled_path):
+                scaled_pixmap = QtGui.QPixmap(prescaled_path)
+            else:
+                logo_pixmap = QtGui.QPixmap(config.LOGO_PATH)
+                scaled_pixmap = logo_pixmap.scaled(
+                    logo_size,
+                    logo_size,
+                    QtCore.Qt.KeepAspectRatio,
+                    QtCore.Qt.SmoothTransformation,
+                )
+            QtGui.QPixmapCache.insert(cache_key, scaled_pixmap)
         logo_label.setPixmap(scaled_pixmap)
         logo_label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-        logo_label.setStyleSheet("padding-right: 10px;")  # Reduced padding
         title_layout.addWidget(logo_label)
 
         # Create a container for title and subtitle
@@ -209,16 +399,14 @@ class AttendanceApp(QtWidgets.QMainWindow):
         # Title text
         title_label = QtWidgets.QLabel("Associated Student Government", self)
         title_label.setAlignment(QtCore.Qt.AlignCenter)
-        title_font = QtGui.QFont("Arial", title_size, QtGui.QFont.Bold)
-        title_label.setFont(title_font)
+        title_label.setFont(fonts.title)
         text_layout.addWidget(title_label)
 
         # Subtitle
         subtitle_label = QtWidgets.QLabel("Los Angeles City College", self)
         subtitle_label.setAlignment(QtCore.Qt.AlignCenter)
-        subtitle_font = QtGui.QFont("Arial", subtitle_size)
-        subtitle_label.setFont(subtitle_font)
-        subtitle_label.setStyleSheet("margin-top: -5px;")  # Negative margin to pull up
+        subtitle_label.setFont(fonts.subtitle)
+        subtitle_label.setObjectName("subtitle")  # Styled with a negative top margin
         text_layout.addWidget(subtitle_label)
 
         # Add the text container to the title layout
@@ -233,24 +421,15 @@ class AttendanceApp(QtWidgets.QMainWindow):
         # Welcome/Goodbye message container
         message_container = QtWidgets.QWidget()
         message_container.setFixedHeight(80)  # Fixed height to prevent layout changes
-        message_container.setStyleSheet(
-            """
-            QWidget {
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 15px;
-                margin: 5px 0;
-            }
-            """
-        )
+        message_container.setObjectName("message")
         message_layout = QtWidgets.QVBoxLayout(message_container)
         message_layout.setContentsMargins(10, 5, 10, 5)
 
         # Info label for welcome/goodbye messages and datetime
         self.info_label = QtWidgets.QLabel("", self)
         self.info_label.setAlignment(QtCore.Qt.AlignCenter)
-        info_font = QtGui.QFont("Arial", info_size, QtGui.QFont.Bold)
-        self.info_label.setFont(info_font)
-        self.info_label.setStyleSheet("color: white;")
+        self.info_label.setFont(fonts.info)
+        self.info_label.setStyleSheet(_DATETIME_QSS)
         self.info_label.setWordWrap(True)
         message_layout.addWidget(self.info_label)
         message_container.show()  # Always show the container since it will display datetime
@@ -260,50 +439,28 @@ class AttendanceApp(QtWidgets.QMainWindow):
 
         # Content container
         content_container = QtWidgets.QWidget()
-        content_container.setStyleSheet(
-            """
-            QWidget {
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 15px;
-                padding: 15px;
-            }
-        """
-        )
+        content_container.setObjectName("content")
         content_layout = QtWidgets.QVBoxLayout(content_container)
 
         # Log text area
         self.log_text = QtWidgets.QPlainTextEdit(self)
+        self.log_text.setObjectName("log")
         self.log_text.setReadOnly(True)
-        self.log_text.setMaximumBlockCount(100)
-        log_font = QtGui.QFont("Monospace", log_size)
-        log_font.setStyleHint(QtGui.QFont.TypeWriter)
-        self.log_text.setFont(log_font)
-        self.log_text.setStyleSheet(
-            """
-            QPlainTextEdit {
-                background-color: rgba(0, 0, 0, 0.3);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 15px;
-                padding: 15px;
-                color: white;
-            }
-        """
-        )
+        self.log_text.setMaximumBlockCount(_LOG_MAX_LINES)
+        self.log_text.setUndoRedoEnabled(False)  # Read-only; keep no edit history
+        self.log_text.setCenterOnScroll(False)  # Scroll only as far as the cursor
+        self.log_text.setFont(fonts.log)
+        # Kept for _flush_log; the document and scrollbar live as long as the view
+        self._log_document = self.log_text.document()
+        self._log_cursor = QtGui.QTextCursor(self._log_document)
+        self._log_scrollbar = self.log_text.verticalScrollBar()
         content_layout.addWidget(self.log_text)
 
         main_layout.addWidget(content_container)
 
         # Footer with Dash Tech credit
         footer_container = QtWidgets.QWidget()
-        footer_container.setStyleSheet(
-            """
-            QWidget {
-                background: rgba(0, 0, 0, 0.3);
-                border-top: 1px solid rgba(255, 255, 255, 0.1);
-                margin: 5px 0px 2px 0px;
-            }
-            """
-        )
+        footer_container.setObjectName("footer")
         footer_container.setFixedHeight(
             35
         )  # Increased height for better button visibility
@@ -312,48 +469,18 @@ class AttendanceApp(QtWidgets.QMainWindow):
 
         # Add Check Hours button
         check_hours_btn = QtWidgets.QPushButton("Check Hours", self)
-        check_hours_btn.setFont(QtGui.QFont("Arial", 11))
+        check_hours_btn.setFont(fonts.button)
         check_hours_btn.setFixedWidth(120)  # Fixed width to prevent squishing
         check_hours_btn.setFixedHeight(25)  # Fixed height for better proportions
-        check_hours_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 5px;
-                padding: 2px 10px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-            """
-        )
         check_hours_btn.clicked.connect(self.show_check_hours_window)
         footer_layout.addWidget(check_hours_btn)
 
         # Add Upload Logs button
         upload_logs_btn = QtWidgets.QPushButton("Upload Logs", self)
-        upload_logs_btn.setFont(QtGui.QFont("Arial", 11))
+        upload_logs_btn.setObjectName("uploadLogs")
+        upload_logs_btn.setFont(fonts.button)
         upload_logs_btn.setFixedWidth(120)  # Fixed width to prevent squishing
         upload_logs_btn.setFixedHeight(25)  # Fixed height for better proportions
-        upload_logs_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 5px;
-                padding: 2px 10px;
-                color: white;
-                font-weight: bold;
-                margin-left: 10px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-            """
-        )
         upload_logs_btn.clicked.connect(self.upload_logs)
         footer_layout.addWidget(upload_logs_btn)
 
@@ -361,14 +488,8 @@ class AttendanceApp(QtWidgets.QMainWindow):
         footer_layout.addStretch()
 
         footer_label = QtWidgets.QLabel("powered by Dash Technology", self)
-        footer_font = QtGui.QFont("Arial", 11)  # Even smaller font size
-        footer_font.setItalic(True)
-        footer_label.setFont(footer_font)
-        footer_label.setStyleSheet(
-            """
-            color: rgba(255, 255, 255, 0.8);
-            """
-        )
+        footer_label.setFont(fonts.footer)
+        footer_label.setObjectName("credit")
 
         # Make the label clickable
         footer_label.setCursor(QtCore.Qt.PointingHandCursor)
@@ -381,6 +502,7 @@ class AttendanceApp(QtWidgets.QMainWindow):
         main_layout.setStretch(0, 2)  # Header takes 2 parts
         main_layout.setStretch(1, 5)  # Content takes 5 parts (reduced from 6)
         main_layout.setStretch(2, 0)  # Footer fixed height
+        main_layout.activate()  # Single layout pass for the finished tree
 
     def _show_error_and_exit(self, message: str) -> None:
         """
@@ -391,46 +513,45 @@ class AttendanceApp(QtWidgets.QMainWindow):
         QtWidgets.QMessageBox.critical(self, "Critical Error", message)
         sys.exit(1)
 
-    def _on_card_detected(self, card_id: str) -> None:
-        """
-        Callback function for RFID card detection.
-        Emits the card_detected signal to be handled in the main thread.
-
-        @param card_id: The detected card's ID
-        """
-        if card_id:  # Only emit if card_id is valid
-            self.card_detected.emit(card_id)
-
     def set_circle_color(self, color: str) -> None:
         """
-        Sets the status circle color.
+        Sets the status circle color. The color comes from the status property
+        selectors in _APP_QSS, so changing it re-polishes the circle against
+        the cached rules instead of parsing a new stylesheet.
 
-        @param color: Color to set the circle to (e.g., 'grey', 'green', 'red')
+        @param color: Color to set the circle to (e.g., 'grey', 'green', 'red');
+                      anything else shows grey
         """
-        color_map = {
-            "grey": "rgba(128, 128, 128, 0.5)",
-            "green": "rgba(0, 255, 0, 0.5)",
-            "red": "rgba(255, 0, 0, 0.5)",
-        }
-        self.status_circle.setStyleSheet(
-            f"""
-            QWidget {{
-                background-color: {color_map.get(color, color_map['grey'])};
-                border-radius: 75px;
-                border: 2px solid rgba(255, 255, 255, 0.2);
-            }}
-            """
-        )
+        if self.status_circle.property("status") != color:
+            self.status_circle.setProperty("status", color)
+            self.status_circle.style().unpolish(self.status_circle)
+            self.status_circle.style().polish(self.status_circle)
 
     def reset_circle_color(self) -> None:
         """Resets the status circle color to grey after delay."""
         self.set_circle_color("grey")
         self.is_processing_tap = False
+        if not self.is_sleeping:
+            self._set_breathing(True)
 
+    def _set_breathing(self, active: bool) -> None:
+        """
+        Pauses or resumes the status circle's breathing animation.
+
+        @param active: True to resume the animation, False to pause it
+        """
+        state = self.breath_animation.state()
+        if active and state == QtCore.QAbstractAnimation.Paused:
+            self.breath_animation.resume()
+        elif not active and state == QtCore.QAbstractAnimation.Running:
+            self.breath_animation.pause()
+
+    @QtCore.pyqtSlot(str)
     def handle_tap(self, rfid_tag: str) -> None:
         """
         Handles a tap event from the RFID reader.
-        Determines whether to sign in or sign out based on the current active session.
+        The database work runs on the thread pool in _process_tap and the
+        result is shown by _on_tap_result on the GUI thread.
 
         @param rfid_tag: The RFID card identifier
         """
@@ -442,110 +563,141 @@ class AttendanceApp(QtWidgets.QMainWindow):
         if self.is_sleeping:
             return  # Ignore card taps while system is sleeping
 
+        # Hold the animation still until the circle is reset after this tap
+        self._set_breathing(False)
+
         if not rfid_tag:
             self.show_message("Error: Invalid card read.", error=True)
             self.set_circle_color("red")
-            QtCore.QTimer.singleShot(
-                config.MESSAGE_DISPLAY_DURATION, self.reset_circle_color
-            )
+            self._reset_timer.start(config.MESSAGE_DISPLAY_DURATION)
             return
 
+        tapped_at = datetime.now().astimezone()
+        worker = Worker(self._process_tap, rfid_tag, tapped_at)
+        worker.signals.finished.connect(self._on_tap_result)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _process_tap(self, rfid_tag: str, tapped_at: datetime) -> Dict[str, Any]:
+        """
+        Records a sign in or sign out based on the current active session.
+        Runs off the GUI thread and must not touch any widgets.
+
+        @param rfid_tag: The RFID card identifier
+        @param tapped_at: Timezone-aware time of the tap
+        @return: Dictionary with the tap time, member, event ("in" or
+                 "out"), duration, error code (None on success) and, for
+                 unexpected errors, the exception message
+        """
+        result: Dict[str, Any] = {
+            "tapped_at": tapped_at,
+            "member": None,
+            "event": None,
+            "duration": None,
+            "error": None,
+        }
+
         try:
             # Get member information
             member = self.db_manager.get_member_by_rfid(rfid_tag)
             if not member:
-                self.show_message("Error: Unknown RFID card.", error=True)
-                self.set_circle_color("red")
-                QtCore.QTimer.singleShot(
-                    config.MESSAGE_DISPLAY_DURATION, self.reset_circle_color
-                )
-                return
-
-            # Get member's position information
-            position_name = member["position"]
-            elected_name = member["name"]
-            first_name = member["name"].split(" ")[0]
-            current_time = datetime.now().strftime("%I:%M %p")
+                result["error"] = "unknown_card"
+                return result
+            result["member"] = member
 
             # Check if an active session exists for this member
             active_session = self.db_manager.get_active_session(member["id"])
             if active_session is None:
                 # No active session; record sign in
-                log_entry = self.db_manager.sign_in(rfid_tag)
-                if log_entry is not None:
-                    if isinstance(log_entry, dict):
-                        if log_entry.get("error") == "after_hours":
-                            self.show_message(
-                                "Sign-in not allowed after 7:00 PM", error=True
-                            )
-                            self.set_circle_color("red")
-                            QtCore.QTimer.singleShot(
-                                config.MESSAGE_DISPLAY_DURATION, self.reset_circle_color
-                            )
-                            return
-                        elif log_entry.get("error") == "before_hours":
-                            self.show_message(
-                                "Sign-in not allowed before 7:30 AM", error=True
-                            )
-                            self.set_circle_color("red")
-                            QtCore.QTimer.singleShot(
-                                config.MESSAGE_DISPLAY_DURATION, self.reset_circle_color
-                            )
-                            return
-                    self.show_message(
-                        f"Welcome {first_name}! Signed in at {current_time}"
-                    )
-                    self.set_circle_color("green")
-                    self.append_log(
-                        f"Sign in recorded for {elected_name} ({position_name}).",
-                        is_sign_in=True,
-                    )
-
-                    # Send Discord notification for tap in
-                    self.discord_webhook.send_tap_notification(
-                        member_name=elected_name,
-                        position=position_name,
-                        event_type="in",
-                    )
-                else:
-                    self.show_message("Error recording sign in.", error=True)
-                    self.set_circle_color("red")
+                result["event"] = "in"
+                log_entry = self.db_manager.sign_in(rfid_tag, member["id"])
+                if log_entry is None:
+                    result["error"] = "sign_in_failed"
+                elif log_entry.get("error"):
+                    result["error"] = log_entry["error"]
             else:
                 # Active session exists; record sign out
-                duration = self.db_manager.sign_out(rfid_tag)
-                if duration is not None:
-                    self.show_message(
-                        f"Goodbye {first_name}! Signed out at {current_time}"
-                    )
-                    self.set_circle_color("red")
-                    self.append_log(
-                        f"Sign out recorded for {elected_name} ({position_name}). "
-                        f"Duration: {duration:.2f} hours.",
-                        is_sign_out=True,
-                    )
+                result["event"] = "out"
+                result["duration"] = self.db_manager.sign_out(rfid_tag, member["id"])
+                if result["duration"] is None:
+                    result["error"] = "sign_out_failed"
+        except Exception as e:
+            result["error"] = "exception"
+            result["message"] = str(e)
+        return result
 
-                    # Send Discord notification for tap out
-                    self.discord_webhook.send_tap_notification(
-                        member_name=elected_name,
-                        position=position_name,
-                        event_type="out",
-                        duration=duration,
-                    )
-                else:
-                    self.show_message("Error recording sign out.", error=True)
-                    self.set_circle_color("red")
+    def _on_tap_result(self, result: Dict[str, Any]) -> None:
+        """
+        Shows the outcome of a tap recorded by _process_tap. Runs on the GUI thread.
 
-            # Reset circle color after the configured duration
-            QtCore.QTimer.singleShot(
-                config.MESSAGE_DISPLAY_DURATION, self.reset_circle_color
-            )
+        @param result: The dictionary returned by _process_tap
+        """
+        error = result["error"]
+        member = result["member"]
 
-        except Exception as e:
-            self.show_message(f"Error processing card: {str(e)}", error=True)
+        if error == "exception":
+            self.show_message(f"Error processing card: {result['message']}", error=True)
             self.set_circle_color("red")
-            QtCore.QTimer.singleShot(
-                config.MESSAGE_DISPLAY_DURATION, self.reset_circle_color
-            )
+        elif error == "unknown_card":
+            self.show_message("Error: Unknown RFID card.", error=True)
+            self.set_circle_color("red")
+        elif error == "after_hours":
+            self.show_message("Sign-in not allowed after 7:00 PM", error=True)
+            self.set_circle_color("red")
+        elif error == "before_hours":
+            self.show_message("Sign-in not allowed before 7:30 AM", error=True)
+            self.set_circle_color("red")
+        elif error == "sign_in_failed":
+            self.show_message("Error recording sign in.", error=True)
+            self.set_circle_color("red")
+        elif error == "sign_out_failed":
+            self.show_message("Error recording sign out.", error=True)
+            self.set_circle_color("red")
+        else:
+            # Get member's position information
+            position_name = member["position"]
+            elected_name = member["name"]
+            first_name = member["first_name"]
+            tapped_at = result["tapped_at"]
+            current_time = f"{tapped_at:%I:%M %p}"
+
+            if result["event"] == "in":
+                self.show_message(f"Welcome {first_name}! Signed in at {current_time}")
+                self.set_circle_color("green")
+                self.append_log(
+                    f"Sign in recorded for {elected_name} ({position_name}).",
+                    is_sign_in=True,
+                    now=tapped_at,
+                )
+
+                # Send Discord notification for tap in
+                self.discord_webhook.send_tap_notification(
+                    member_name=elected_name,
+                    position=position_name,
+                    event_type="in",
+                    tapped_at=tapped_at,
+                )
+            else:
+                duration = result["duration"]
+                self.show_message(f"Goodbye {first_name}! Signed out at {current_time}")
+                self.set_circle_color("red")
+                self.append_log(
+                    f"Sign out recorded for {elected_name} ({position_name}). "
+                    f"Duration: {duration:.2f} hours.",
+                    is_sign_out=True,
+                    now=tapped_at,
+                )
+
+                # Send Discord notification for tap out
+                self.discord_webhook.send_tap_notification(
+                    member_name=elected_name,
+                    position=position_name,
+                    event_type="out",
+                    duration=duration,
+                    tapped_at=tapped_at,
+                )
+
+        # Reset circle color after the configured duration
+        self._reset_timer.start(config.MESSAGE_DISPLAY_DURATION)
 
     def check_system_state(self) -> None:
         """
@@ -554,16 +706,12 @@ class AttendanceApp(QtWidgets.QMainWindow):
         System sleeps during weekends (Saturday and Sunday).
         """
         current_time = datetime.now()
+        self._schedule_state_check(current_time)
         current_hour = current_time.hour
         current_minute = current_time.minute
         current_date = current_time.date()
         current_weekday = current_time.weekday()  # Monday is 0, Sunday is 6
 
-        # Reset auto sign-out attempt flag at the start of each hour
-        if current_minute == 0 and self.auto_signout_attempted:
-            self.auto_signout_attempted = False
-            self.append_log("Reset auto sign-out attempt flag for new hour")
-
         # Check if it's a weekend (Saturday = 5, Sunday = 6)
         is_weekend = current_weekday in (5, 6)
 
@@ -576,20 +724,8 @@ class AttendanceApp(QtWidgets.QMainWindow):
                     self.append_log("System entering weekend sleep mode.")
             else:
                 # Regular weekday sleep check
-                should_sleep = (
-                    (
-                        current_hour < config.START_TIME_HOUR
-                        or (
-                            current_hour == config.START_TIME_HOUR
-                            and current_minute < config.START_TIME_MINUTE
-                        )
-                    )
-                    or (
-                        current_hour == config.SLEEP_TIME_HOUR
-                        and current_minute >= config.SLEEP_TIME_MINUTE
-                    )
-                    or current_hour > config.SLEEP_TIME_HOUR
-                )
+                now_t = current_time.time()
+                should_sleep = now_t < _START_T or now_t >= _SLEEP_T
 
         # Apply sleep state
         if should_sleep:
@@ -606,16 +742,15 @@ class AttendanceApp(QtWidgets.QMainWindow):
             not self.is_sleeping
             and current_hour == config.AUTO_SIGNOUT_HOUR
             and current_minute == 0
-            and not self.auto_signout_attempted
             and (
                 self.last_auto_signout_date is None
                 or self.last_auto_signout_date != current_date
             )
         ):
             self.append_log(
-                f"Attempting auto sign-out at {current_time.strftime('%I:%M %p')}"
+                f"Attempting auto sign-out at {current_time:%I:%M %p}",
+                now=current_time,
             )
-            self.auto_signout_attempted = True
 
             result = self.db_manager.auto_sign_out()
             if result:
@@ -627,6 +762,7 @@ class AttendanceApp(QtWidgets.QMainWindow):
                     )
 
                     # Send Discord notification for auto sign-out
+                    signed_out_at = current_time.astimezone()
                     for member in result["members"]:
                         # Extract name and position from the member string
                         # Format is "Name (Position)"
@@ -639,6 +775,7 @@ class AttendanceApp(QtWidgets.QMainWindow):
                                 position=position,
                                 event_type="out",
                                 duration=None,  # Duration not available for auto sign-out
+                                tapped_at=signed_out_at,
                             )
                 else:
                     self.append_log(
@@ -648,63 +785,85 @@ class AttendanceApp(QtWidgets.QMainWindow):
                 self.last_auto_signout_date = current_date
 
                 # Upload system logs after auto sign-out
-                logs = self.log_text.toPlainText()
-                if logs.strip():
-                    if self.db_manager.upload_system_logs(logs):
-                        self.log_text.clear()
-                        self.append_log(
-                            "System logs were automatically uploaded after auto sign-out."
-                        )
-                    else:
-                        self.append_log(
-                            "Failed to upload system logs after auto sign-out.",
-                            error=True,
-                        )
+                self._start_log_upload(auto=True)
             else:
                 self.append_log(
                     "Auto sign-out attempt failed or no members to sign out",
                     is_sign_out=True,
                 )
 
+    def _schedule_state_check(self, now: datetime) -> None:
+        """
+        Arms the state timer for the next sleep, wake or auto sign-out
+        boundary, or at most _STATE_CHECK_MAX_INTERVAL from now.
+
+        @param now: The current local time
+        """
+        next_check = now + _STATE_CHECK_MAX_INTERVAL
+        for hour, minute in _STATE_BOUNDARIES:
+            boundary = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if boundary <= now:
+                boundary += timedelta(days=1)
+            next_check = min(next_check, boundary + _STATE_CHECK_MARGIN)
+        delay_ms = int((next_check - now).total_seconds() * 1000)
+        self.state_timer.start(max(delay_ms, 0))
+
     def sleep_system(self) -> None:
         """Puts the system to sleep."""
         self.is_sleeping = True
-        self.central_widget.setVisible(False)
-        self.setStyleSheet("background-color: black;")
+        self.central_widget.hide()
+        self.central_widget.setEnabled(False)
         self.append_log("System entering sleep mode until 8:00 AM.")
 
-        # Stop the RFID reader
-        if hasattr(self, "rfid_reader"):
-            self.rfid_reader.stop_reading()
-            if hasattr(self, "reader_thread") and self.reader_thread.is_alive():
-                self.reader_thread.join(timeout=1.0)
+        # Drop any message, then stop the clock and message timers; nothing is
+        # visible while asleep
+        self.clear_welcome_message()
+        self.datetime_timer.stop()
+        self.message_timer.stop()
+        self._set_breathing(False)
+
+        # Pause the RFID reader; the thread and GPIO stay up for wake
+        if self.rfid_worker is not None:
+            self.rfid_worker.pause()
 
     def wake_system(self) -> None:
         """Wakes up the system."""
         self.is_sleeping = False
-        self.central_widget.setVisible(True)
-        self.setStyleSheet("background-color: black; color: white;")
+        self.central_widget.setEnabled(True)
+        self.central_widget.show()
         self.append_log("Good morning! System resuming normal operation.")
 
-        # Restart the RFID reader
-        self.start_rfid_reader()
+        # Show the current time and restart the clock timer
+        self.update_datetime()
+        self._set_breathing(True)
+
+        # Resume the RFID reader
+        if self.rfid_worker is not None:
+            self.rfid_worker.resume()
 
     def start_rfid_reader(self) -> None:
-        """Starts the RFID reader in a separate thread."""
-        self.reader_thread = Thread(
-            target=self.rfid_reader.start_reading,
-            args=(self._on_card_detected,),
-            daemon=True,
-        )
-        self.reader_thread.start()
+        """Starts the RFID reader on its worker thread."""
+        self.rfid_worker.start()
 
     def update_datetime(self) -> None:
-        """Updates the date and time display in the info label when no message is shown."""
-        if not self.is_showing_message:  # Only update if no message is being shown
-            current_datetime = datetime.now()
-            formatted_datetime = current_datetime.strftime("%B %d, %Y %I:%M:%S %p")
-            self.info_label.setText(f"{formatted_datetime}")
-            self.info_label.setStyleSheet("color: #CCCCCC; font-size: 16pt;")
+        """
+        Updates the date and time display in the info label when no message is
+        shown. The clock stops while a message is up; clear_welcome_message
+        restarts it.
+        """
+        if self.is_showing_message:
+            return
+
+        # Format on the Qt side; same output as "%B %d, %Y %I:%M:%S %p"
+        formatted_datetime = QtCore.QDateTime.currentDateTime().toString(
+            "MMMM dd, yyyy hh:mm:ss AP"
+        )
+        if formatted_datetime != self._last_dt_str:
+            self.info_label.setText(formatted_datetime)
+            self._last_dt_str = formatted_datetime
+
+        # Fire again at the start of the next second
+        self.datetime_timer.start(1000 - QtCore.QTime.currentTime().msec())
 
     def show_message(self, message: str, error: bool = False) -> None:
         """
@@ -733,48 +892,94 @@ class AttendanceApp(QtWidgets.QMainWindow):
         """Clears the welcome/goodbye message and shows the current time."""
         self.is_showing_message = False  # Clear flag to allow datetime updates
         self.info_label.clear()  # Clear the current message first
+        self.info_label.setStyleSheet(_DATETIME_QSS)
+        self._last_dt_str = ""
         self.update_datetime()  # Show current time after clearing message
 
     def append_log(
-        self, log_message: str, is_sign_in: bool = False, is_sign_out: bool = False
+        self,
+        log_message: str,
+        is_sign_in: bool = False,
+        is_sign_out: bool = False,
+        now: Optional[datetime] = None,
     ) -> None:
         """
-        Appends a log message with a timestamp to the log text area.
-        Implements memory-efficient logging for Raspberry Pi.
+        Sends a log message to the log text area. Safe to call from any thread.
 
         @param log_message: The log message to append.
         @param is_sign_in: Flag to indicate if this is a sign-in message (green).
         @param is_sign_out: Flag to indicate if this is a sign-out message (red).
+        @param now: Optional time to stamp the line with; defaults to the current time.
         """
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if is_sign_in:
+            kind = self._LOG_SIGN_IN
+        elif is_sign_out:
+            kind = self._LOG_SIGN_OUT
+        else:
+            kind = self._LOG_PLAIN
+        if now is None:
+            now = datetime.now()
+        # Lines logged within the same second reuse the formatted timestamp
+        second = int(now.timestamp())
+        cached_second, timestamp = self._log_ts_cache
+        if second != cached_second:
+            timestamp = now.strftime(_LOG_TS_FMT)
+            self._log_ts_cache = (second, timestamp)
+        self.log_message.emit(_LOG_LINE.format(timestamp, log_message), kind)
+
+    @QtCore.pyqtSlot(str, int)
+    def _append_log_slot(self, line: str, kind: int) -> None:
+        """
+        Buffers a timestamped log line for the next flush. While the system
+        sleeps the log is hidden, so lines stay buffered until it wakes.
+        Always runs on the GUI thread.
 
-            # Create HTML formatted text with color
-            if is_sign_in:
-                colored_text = (
-                    f'<span style="color: #00FF00;">[{timestamp}] {log_message}</span>'
-                )
-            elif is_sign_out:
-                colored_text = (
-                    f'<span style="color: #FF0000;">[{timestamp}] {log_message}</span>'
-                )
-            else:
-                colored_text = f"[{timestamp}] {log_message}"
+        @param line: The timestamped log line.
+        @param kind: One of _LOG_PLAIN, _LOG_SIGN_IN or _LOG_SIGN_OUT.
+        """
+        self._log_buffer.append((line, kind))
+        self._log_lines.append((line, kind))
+        if not self.is_sleeping and not self._log_flush_timer.isActive():
+            self._log_flush_timer.start(_LOG_FLUSH_DELAY_MS)
 
-            # Append the text with HTML formatting
-            cursor = self.log_text.textCursor()
+    def _flush_log(self) -> None:
+        """
+        Writes buffered log lines to the log text area in one batch, one
+        block per line so setMaximumBlockCount trims old entries.
+        """
+        self._log_flush_timer.stop()
+        if not self._log_buffer:
+            return
+        try:
+            document = self._log_document
+            cursor = self._log_cursor
             cursor.movePosition(QtGui.QTextCursor.End)
-            cursor.insertHtml(colored_text + "<br>")
-
-            # Ensure the latest message is visible
-            self.log_text.verticalScrollBar().setValue(
-                self.log_text.verticalScrollBar().maximum()
-            )
-
-            # Process events to prevent UI freezing on RPi
-            QtWidgets.QApplication.processEvents()
+            # Follow new lines only if the view was already at the bottom, so
+            # scrolling back through the log is not interrupted
+            scrollbar = self._log_scrollbar
+            at_bottom = scrollbar.value() >= scrollbar.maximum()
+
+            # Lay out and repaint once for the whole batch instead of once per
+            # line: the edit block makes the document report a single change
+            self.log_text.setUpdatesEnabled(False)
+            cursor.beginEditBlock()
+            try:
+                for line, kind in self._log_buffer:
+                    if not document.isEmpty():
+                        cursor.insertBlock()
+                    cursor.insertText(line, self._LOG_FORMATS[kind])
+            finally:
+                cursor.endEditBlock()
+                self.log_text.setUpdatesEnabled(True)
+
+            if at_bottom:
+                # Ensure the latest message is visible by scrolling to the cursor
+                self.log_text.moveCursor(QtGui.QTextCursor.End)
+                self.log_text.ensureCursorVisible()
         except Exception as e:
             print(f"Error appending log: {str(e)}")
+        finally:
+            self._log_buffer.clear()
 
     def show_registration_window(
         self, event: Optional[QtGui.QMouseEvent] = None
@@ -784,28 +989,10 @@ class AttendanceApp(QtWidgets.QMainWindow):
         This is a secret function triggered by clicking the footer text.
         """
         try:
-            # Stop the current RFID reader
-            if hasattr(self, "rfid_reader"):
-                self.rfid_reader.stop_reading()
-                if hasattr(self, "reader_thread"):
-                    self.reader_thread.join(timeout=1.0)
-
-            # Show registration dialog with the same RFID reader instance
-            registration = RegistrationWindow(parent=self, rfid_reader=self.rfid_reader)
-
-            # Ensure the registration window is properly displayed
-            registration.setWindowModality(QtCore.Qt.ApplicationModal)
-            registration.show()  # Show the window first
-            registration.raise_()  # Raise it to the top
-            registration.activateWindow()  # Make it the active window
-
-            result = registration.exec_()
-
-            # Reinitialize and restart the RFID reader
-            if hasattr(self, "rfid_reader"):
-                self.rfid_reader.reinitialize()
-                self.start_rfid_reader()
+            # Imported on first use; the dialog is rarely opened
+            from registration_window import RegistrationWindow
 
+            result = self._run_dialog(RegistrationWindow)
             if result == QtWidgets.QDialog.Accepted:
                 self.append_log("New member registration completed successfully.")
 
@@ -818,60 +1005,127 @@ class AttendanceApp(QtWidgets.QMainWindow):
         This allows members to check their accumulated hours by tapping their RFID card.
         """
         try:
-            # Stop the current RFID reader
-            if hasattr(self, "rfid_reader"):
-                self.rfid_reader.stop_reading()
-                if hasattr(self, "reader_thread"):
-                    self.reader_thread.join(timeout=1.0)
-
             # Import here to avoid circular imports
             from check_window import CheckHoursWindow
 
-            # Show check hours dialog with the same RFID reader instance
-            check_window = CheckHoursWindow(parent=self, rfid_reader=self.rfid_reader)
-            check_window.setWindowModality(QtCore.Qt.ApplicationModal)
-            check_window.show()
-            check_window.raise_()
-            check_window.activateWindow()
-
-            result = check_window.exec_()
-
-            # Reinitialize and restart the RFID reader
-            if hasattr(self, "rfid_reader"):
-                self.rfid_reader.reinitialize()
-                self.start_rfid_reader()
+            self._run_dialog(CheckHoursWindow)
 
         except Exception as e:
             self._show_error_and_exit(f"Error opening check hours window: {str(e)}")
 
+    def _run_dialog(self, dialog_class: Callable[..., QtWidgets.QDialog]) -> int:
+        """
+        Runs a full-screen dialog modally. Card reads go to the dialog while
+        it is open and back to handle_tap once it closes.
+
+        @param dialog_class: Dialog taking parent and rfid_worker keyword arguments
+        @return: The dialog's result code
+        """
+        # Route card reads to the dialog instead of the tap handler
+        self.rfid_worker.card_detected.disconnect(self.handle_tap)
+        try:
+            # Share the running RFID worker thread with the dialog
+            dialog = dialog_class(parent=self, rfid_worker=self.rfid_worker)
+
+            # exec_() shows the dialog; a newly shown window opens on top with focus
+            dialog.setWindowModality(QtCore.Qt.ApplicationModal)
+            try:
+                return dialog.exec_()
+            finally:
+                # Parented to this window, so delete it explicitly rather than
+                # keep one hidden dialog per opening
+                dialog.deleteLater()
+        finally:
+            # Resume handling taps in the main window
+            self.rfid_worker.card_detected.connect(self.handle_tap)
+
+    def _clear_log(self) -> None:
+        """Clears the log text area along with any lines waiting for a flush."""
+        self._log_flush_timer.stop()
+        self._log_buffer.clear()
+        self._log_lines.clear()
+        self.log_text.clear()
+
     def upload_logs(self) -> None:
         """
         Uploads the current system logs to the database and clears the log display.
         Shows a success or error message based on the upload result.
         """
-        try:
-            # Get the current logs from the text area
-            logs = self.log_text.toPlainText()
+        # Includes lines still waiting for a flush; every line is timestamped,
+        # so the log is empty only when no lines are kept
+        if not self._log_lines:
+            self.show_message("No logs to upload.", error=True)
+            return
 
-            if not logs.strip():
-                self.show_message("No logs to upload.", error=True)
-                return
+        if self._log_upload is not None:
+            self.show_message("Log upload already in progress.", error=True)
+            return
 
-            # Upload the logs to the database
-            success = self.db_manager.upload_system_logs(logs)
+        # Upload errors are reported by _on_log_upload_failed
+        self._start_log_upload(auto=False)
 
-            if success:
-                # Clear the log text area
-                self.log_text.clear()
-                self.show_message("Logs uploaded successfully!")
-                self.append_log(
-                    "System logs were uploaded to the database and cleared."
-                )
-            else:
-                self.show_message("Failed to upload logs.", error=True)
+    def _start_log_upload(self, auto: bool) -> None:
+        """
+        Clears the log display and uploads its lines on the thread pool. The
+        lines are put back by _on_log_upload_failed if the upload fails.
 
-        except Exception as e:
-            self.show_message(f"Error uploading logs: {str(e)}", error=True)
+        @param auto: True for the upload that follows auto sign-out
+        """
+        if not self._log_lines or self._log_upload is not None:
+            return
+        lines = tuple(self._log_lines)
+        self._log_upload = (lines, auto)
+        self._clear_log()
+
+        worker = Worker(
+            self.db_manager.upload_system_logs,
+            "\n".join(line for line, _ in lines),
+        )
+        worker.signals.finished.connect(self._on_log_upload_result)
+        worker.signals.error.connect(self._on_log_upload_failed)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_log_upload_result(self, success: bool) -> None:
+        """
+        Reports the outcome of a log upload started by _start_log_upload.
+        Runs on the GUI thread.
+
+        @param success: Whether the logs were stored
+        """
+        if not success:
+            self._on_log_upload_failed("")
+            return
+        _, auto = self._log_upload
+        self._log_upload = None
+        if auto:
+            self.append_log(
+                "System logs were automatically uploaded after auto sign-out."
+            )
+        else:
+            self.show_message("Logs uploaded successfully!")
+            self.append_log("System logs were uploaded to the database and cleared.")
+
+    def _on_log_upload_failed(self, error: str) -> None:
+        """
+        Puts the lines of a failed log upload back ahead of any logged since.
+        Runs on the GUI thread.
+
+        @param error: The error message, or an empty string if the upload
+                      was rejected without raising
+        """
+        lines, auto = self._log_upload
+        self._log_upload = None
+        logged_since = tuple(self._log_lines)
+        self._clear_log()
+        for line, kind in lines + logged_since:
+            self._append_log_slot(line, kind)
+
+        if auto:
+            self.append_log("Failed to upload system logs after auto sign-out.")
+        elif error:
+            self.show_message(f"Error uploading logs: {error}", error=True)
+        else:
+            self.show_message("Failed to upload logs.", error=True)
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         """
@@ -881,13 +1135,16 @@ class AttendanceApp(QtWidgets.QMainWindow):
         @param event: The close event
         """
         try:
-            # Stop the RFID reader
-            if hasattr(self, "rfid_reader"):
-                self.rfid_reader.stop_reading()
+            # Stop the RFID reader and wait for its thread to finish
+            if self.rfid_worker is not None:
+                self.rfid_worker.stop()
+
+            # Release the persistent database connection
+            if self.db_manager is not None:
+                self.db_manager.close()
 
-            # Wait for reader thread to finish
-            if hasattr(self, "reader_thread") and self.reader_thread.is_alive():
-                self.reader_thread.join(timeout=1.0)
+            # Flush pending Discord notifications
+            self.discord_webhook.close()
 
             event.accept()
         except Exception as e:
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Background worker module for the attendance system.
+Runs blocking calls (database, network) on Qt's thread pool and reports
+results back to the GUI thread through signals.
+"""
+
+from typing import Any, Callable
+from PyQt5 import QtCore
+
+
+class WorkerSignals(QtCore.QObject):
+    """
+    Signals emitted by a Worker. Slots connected from GUI objects run on the
+    GUI thread through a queued connection.
+    """
+
+    # Emitted with the callable's return value when it completes
+    finished = QtCore.pyqtSignal(object)
+    # Emitted with the error message when the callable raises
+    error = QtCore.pyqtSignal(str)
+
+
+class Worker(QtCore.QRunnable):
+    """
+    Runs a callable on a QThreadPool thread.
+    The callable must not touch widgets; update the UI from a slot connected
+    to signals.finished instead.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the worker.
+
+        @param fn: The blocking callable to run
+        @param args: Positional arguments for the callable
+        @param kwargs: Keyword arguments for the callable
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        """
+        Executes the callable and emits its result or error.
+        """
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as error:
+            print(f"Error in background task: {error}")
+            self.signals.error.emit(str(error))
+            return
+        self.signals.finished.emit(result)